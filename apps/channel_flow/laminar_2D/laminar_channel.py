@@ -21,7 +21,7 @@
 
 # Import all the functions from opensbli
 from opensbli import *
-from opensbli.utilities.helperfunctions import substitute_simulation_parameters, print_iteration_ops
+from opensbli.utilities.helperfunctions import print_iteration_ops
 
 # Problem dimension
 ndim = 2
@@ -198,14 +198,13 @@ alg = TraditionalAlgorithmRK(block)
 SimulationDataType.set_datatype(Double)
 
 # STEP 9
-# Write the OPSC compatible code for the numerical solution
-OPSC(alg)
-
-# STEP 10
 # Populate the values of the constants like Re, Pr etc and the number of points for the
 # simulation etc. In the future reading thes from HDF5 would be provided
 
 constants = ['Re', 'gama', 'Minf', 'Pr', 'dt', 'niter', 'block0np0', 'block0np1', 'Delta0block0', 'Delta1block0', "c0", "c1"]
 values = ['90.0', '1.4', '0.01', '0.72', '0.0001', '3000000', '16', '64', '2.0*M_PI/block0np0', '2.0/(block0np1-1)', '-1', '0']
-substitute_simulation_parameters(constants, values)
+
+# STEP 10
+# Write the OPSC compatible code for the numerical solution
+OPSC(alg, simulation_parameters=dict(zip(constants, values)))
 print_iteration_ops()
@@ -21,7 +21,7 @@
 # Import all the functions from opensbli
 from opensbli import *
 from sympy import sin, log, cos, pi
-from opensbli.utilities.helperfunctions import substitute_simulation_parameters, print_iteration_ops
+from opensbli.utilities.helperfunctions import print_iteration_ops
 
 # STEP 0 Create the equations required for the numerical solution
 # Problem dimension
@@ -244,15 +244,14 @@ alg = TraditionalAlgorithmRK(block)
 SimulationDataType.set_datatype(Double)
 
 # STEP 9
-# Write the OPSC compatible code for the numerical solution
-OPSC(alg)
-
-# STEP 10
 # Populate the values of the constants like Re, Pr etc and the number of points for the
 # simulation etc. In the future reading thes from HDF5 would be provided
 constants = ['Re', 'gama', 'Minf', 'Pr', 'dt', 'niter', 'block0np0', 'block0np1',
     'block0np2', 'Delta0block0', 'Delta1block0', 'Delta2block0', "c0", "c1", "c2", "lx0", "lx2"]
 values = ['180.0', '1.4', '0.01', '0.72', '0.00001', '100000', '180', '140', '120',
     '11.0/block0np0', '2.0/(block0np1-1)', '4.0/block0np2', '-1', '0', '0', "11.0", "4.0"]
-substitute_simulation_parameters(constants, values)
+
+# STEP 10
+# Write the OPSC compatible code for the numerical solution
+OPSC(alg, simulation_parameters=dict(zip(constants, values)))
 print_iteration_ops()
@@ -7,12 +7,12 @@ import argparse
 def check(fname):
     opensbli_output_file = h5py.File(fname, 'r')
     # Loop over blocks 
-    for block in opensbli_output_file.keys():
+    for block in opensbli_output_file:
         group_block =  opensbli_output_file[block]
         # Loop over all the datasets on block
-        for key in group_block.keys():
+        for key in group_block:
             # Check if the dataset is NaN
-            if numpy.isnan(group_block[key].value).any():
+            if numpy.isnan(group_block[key][()]).any():
                 print("Dataset %s on block %s has  NaN" % (key, block))
             else:
                 print("Dataset %s on block %s is OK" % (key, block))
@@ -21,7 +21,6 @@
 # Import all the functions from opensbli
 from opensbli import *
 import copy
-from opensbli.utilities.helperfunctions import substitute_simulation_parameters
 
 ndim = 2
 
@@ -160,7 +159,6 @@ block.discretise()
 
 alg = TraditionalAlgorithmRK(block)
 SimulationDataType.set_datatype(Double)
-OPSC(alg)
 constants = ['gama', 'Minf', 'dt', 'niter', 'block0np0', 'block0np1', 'Delta0block0', 'Delta1block0']
 values = ['1.4', '2.0', '0.1', '10000', '457', '255', '350.0/(block0np0-1)', '115.0/(block0np1-1)']
-substitute_simulation_parameters(constants, values)
+OPSC(alg, simulation_parameters=dict(zip(constants, values)))
@@ -21,7 +21,6 @@
 from opensbli import *
 import copy
 from opensbli.utilities.simple_katzer_init import Initialise_Katzer
-from opensbli.utilities.helperfunctions import substitute_simulation_parameters
 
 ndim = 2
 sc1 = "**{\'scheme\':\'Weno\'}"
@@ -149,11 +148,10 @@ block.discretise()
 
 alg = TraditionalAlgorithmRK(block)
 SimulationDataType.set_datatype(Double)
-OPSC(alg)
 # Substitute simulation parameter values
 constants = ['gama', 'Minf', 'Pr', 'Re', 'Twall', 'dt', 'niter', 'block0np0', 'block0np1',
                  'Delta0block0', 'Delta1block0', 'SuthT', 'RefT', 'eps', 'TENO_CT', 'Lx1', 'by', 'harten']
 values = ['1.4', '2.0', '0.72', '950.0', '1.67619431', '0.04', '325000', '500', '250',
               '400.0/(block0np0-1)', '115.0/(block0np1-1)', '110.4', '288.0', '1e-15', '1e-5', '115.0', '5.0', '0.25']
-substitute_simulation_parameters(constants, values)
+OPSC(alg, simulation_parameters=dict(zip(constants, values)))
 print_iteration_ops()
@@ -19,8 +19,9 @@
 #    along with OpenSBLI.  If not, see <http://www.gnu.org/licenses/>.
 
 from opensbli import *
+import copy
 import numpy as np
-from opensbli.utilities.helperfunctions import output_hdf5, substitute_simulation_parameters
+from opensbli.utilities.helperfunctions import output_hdf5
 
 ndim = 2
 # Specify TENO order and initialise characteristic scheme.
@@ -113,7 +114,6 @@ block.discretise()
 
 alg = TraditionalAlgorithmRK(block)
 SimulationDataType.set_datatype(Double)
-OPSC(alg)
 # Random number generation for the initial condition
 # Change grid size here if desired
 npoints = [512, 512]
@@ -126,4 +126,4 @@ output_hdf5(random_numbers, name, halos, npoints, block)
 
 constants = ['gama', 'Minf', 'dt', 'niter', 'block0np0', 'block0np1', 'Delta0block0', 'Delta1block0', 'TENO_CT', 'eps']
 values = ['1.4', '2.0', '0.0001', '50000', '512', '512', '1.0/block0np0', '1.0/block0np1', '1e-5', '1e-15']
-substitute_simulation_parameters(constants, values)
+OPSC(alg, simulation_parameters=dict(zip(constants, values)))
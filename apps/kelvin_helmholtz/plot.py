@@ -27,7 +27,7 @@ def read_file(fname):
     # Read in the simulation output
     dump = glob.glob("./" + fname)
     if not dump or len(dump) > 1:
-        print "Error: No dump file found, or more than one dump file found."
+        print("Error: No dump file found, or more than one dump file found.")
         sys.exit(1)
     f = h5py.File(dump[-1], 'r')
     group = f["opensbliblock00"]
@@ -38,13 +38,11 @@ def plot(files, n_levels, min_val, max_val):
     levels = numpy.linspace(min_val, max_val, n_levels)
 
     for num, file in files:
-        print "Processing image: %d" % num
+        print("Processing image: %d" % num)
         f, group = read_file(file)
         np = group["rho_B0"].shape
-        rho = group["rho_B0"].value
-        rho = rho[5:-5, 5:-5]
-        x, y = group["x0_B0"].value, group["x1_B0"].value
-        x, y = x[5:-5, 5:-5], y[5:-5, 5:-5]
+        rho = group["rho_B0"][5:-5, 5:-5]
+        x, y = group["x0_B0"][5:-5, 5:-5], group["x1_B0"][5:-5, 5:-5]
         fig = plt.figure()
         contour_local(fig, levels, "\\rho", x, y, rho)
         # plt.savefig("./images/kh_image%s.png" % num, bbox_inches='tight', dpi=300)
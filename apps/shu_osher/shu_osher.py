@@ -21,7 +21,6 @@
 # Import all the functions from opensbli
 from opensbli import *
 import copy
-from opensbli.utilities.helperfunctions import substitute_simulation_parameters
 
 ndim = 1
 sc1 = "**{\'scheme\':\'Weno\'}"
@@ -136,7 +135,6 @@ block.discretise()
 
 alg = TraditionalAlgorithmRK(block)
 SimulationDataType.set_datatype(Double)
-OPSC(alg)
 constants = ['gama', 'Minf', 'dt', 'niter', 'block0np0', 'Delta0block0']
 values = ['1.4', '0.1', '0.0002', 'ceil(1.8/0.0002)', '3200', '10.0/(block0np0-1)']
-substitute_simulation_parameters(constants, values)
+OPSC(alg, simulation_parameters=dict(zip(constants, values)))
@@ -22,7 +22,7 @@
 # Import all the functions from opensbli
 from opensbli import *
 import copy
-from opensbli.utilities.helperfunctions import substitute_simulation_parameters, print_iteration_ops
+from opensbli.utilities.helperfunctions import print_iteration_ops
 
 # Number of dimensions of the system to be solved
 ndim = 3
@@ -163,10 +163,9 @@ alg = TraditionalAlgorithmRK(block)
 # set the simulation data type, for more information on the datatypes see opensbli.core.datatypes
 SimulationDataType.set_datatype(Double)
 
-# Write the code for the algorithm
-OPSC(alg)
-
 constants = ['Re', 'gama', 'Minf', 'Pr', 'dt', 'niter', 'block0np0', 'block0np1', 'block0np2', 'Delta0block0', 'Delta1block0', 'Delta2block0']
 values = ['1600.0', '1.4', '0.1', '0.71', '0.003385', '5909', '64', '64', '64', '2*M_PI/block0np0', '2*M_PI/block0np1', '2*M_PI/block0np2']
-substitute_simulation_parameters(constants, values)
+
+# Write the code for the algorithm
+OPSC(alg, simulation_parameters=dict(zip(constants, values)))
 print_iteration_ops()
\ No newline at end of file
@@ -39,7 +39,7 @@ def read_file(fname):
     # Read in the simulation output
     dump = glob.glob("./" + fname)
     if not dump or len(dump) > 1:
-        print "Error: No dump file found, or more than one dump file found."
+        print("Error: No dump file found, or more than one dump file found.")
         sys.exit(1)
     f = h5py.File(dump[-1], 'r')
     group = f["opensbliblock00"]
@@ -49,20 +49,15 @@ def read_file(fname):
 def extract_data(group, lhalo, rhalo, k):
     # linear dimensions of the dataset
     np = group["rho_B0"].shape
-    rho = group["rho_B0"].value
-    rhou = group["rhou0_B0"].value
-    rhov = group["rhou1_B0"].value
-    rhoE = group["rhoE_B0"].value
-    x = group["x0_B0"].value
-    y = group["x1_B0"].value
-
-    rho = rho[lhalo:np[0]-rhalo, lhalo:np[1]-rhalo]
+    # Only read the points inside the halos
+    interior = numpy.s_[lhalo:np[0]-rhalo, lhalo:np[1]-rhalo]
+    rho = group["rho_B0"][interior]
     grid_points = [np[0] - 2*k, np[1] - 2*k]
-    rhou = rhou[lhalo:np[0]-rhalo, lhalo:np[1]-rhalo]
-    rhov = rhov[lhalo:np[0]-rhalo, lhalo:np[1]-rhalo]
-    x = x[lhalo:np[0]-rhalo, lhalo:np[1]-rhalo]
-    y = y[lhalo:np[0]-rhalo, lhalo:np[1]-rhalo]
-    rhoE = rhoE[lhalo:np[0]-rhalo, lhalo:np[1]-rhalo]
+    rhou = group["rhou0_B0"][interior]
+    rhov = group["rhou1_B0"][interior]
+    rhoE = group["rhoE_B0"][interior]
+    x = group["x0_B0"][interior]
+    y = group["x1_B0"][interior]
 
     u = rhou/rho
     v = rhov/rho
@@ -89,7 +84,7 @@ def plot(fname, n_levels):
     f, group1 = read_file(fname)
     x, y, rho, u, v, rhoE, P, M, T = extract_data(group1, 5, 5, 3)
     npx = x.shape[1]
-    print npx
+    print(npx)
     npx = int(npx/3.0)
     x, y = x[:,npx:], y[:,npx:]
     coordinates = [x, y]
@@ -103,8 +98,8 @@ def plot(fname, n_levels):
             min_val = numpy.min(var)
             max_val = numpy.max(var)
             levels = numpy.linspace(min_val, max_val, n_levels)
-            print "%s" % name
-            print levels
+            print("%s" % name)
+            print(levels)
             fig = plt.figure()
             contour_local(fig, levels, "%s" % name, x, y, var)
             pdf.savefig(bbox_inches='tight')
@@ -20,7 +20,6 @@
 
 from opensbli import *
 import copy
-from opensbli.utilities.helperfunctions import substitute_simulation_parameters
 
 """ Viscous shock tube problem in 2D, conditions taken from Numerical simulation of the viscous shock tube problem
 by using a high resolution monotonicity-preserving scheme. Tenaud et al (2009). doi:10.1016/j.compfluid.2008.06.008. """
@@ -127,9 +126,8 @@ block.discretise()
 
 alg = TraditionalAlgorithmRK(block)
 SimulationDataType.set_datatype(Double)
-OPSC(alg)
 constants = ['mu', 'gama', 'Minf', 'Pr', 'Re', 'dt', 'niter', 'block0np0', 'block0np1',
              'Delta0block0', 'Delta1block0', 'eps', 'TENO_CT']
 values = ['1.0', '1.4', '1.0', '0.73', '200.0', '0.00005', '20000', '600', '300',
           '1.0/(block0np0-1)', '0.5/(block0np1-1)', '1e-15', '1e-7']
-substitute_simulation_parameters(constants, values)
+OPSC(alg, simulation_parameters=dict(zip(constants, values)))
@@ -2,7 +2,7 @@
 and plots the scalar field 'phi'. """
 
 import numpy
-from math import pi, sin
+from math import pi
 import matplotlib.pyplot as plt
 import h5py
 import glob
@@ -20,35 +20,23 @@ def plot(path):
     # Read in the simulation output
     dump = glob.glob(path + "/opensbli_output.h5")
     if not dump or len(dump) > 1:
-        print "Error: No dump file found, or more than one dump file found."
+        print("Error: No dump file found, or more than one dump file found.")
         sys.exit(1)
-    f = h5py.File(dump[-1], 'r')
-    group = f["opensbliblock00"]
-
-    phi = group["phi_B0"].value
-    x = group["x0_B0"].value
-
-    # Ignore the 2 halo nodes at either end of the domain
-    phi = phi[halo:nx+halo]
-    x = x[halo:nx+halo]
+    with h5py.File(dump[-1], 'r') as f:
+        # Ignore the halo nodes at either end of the domain, only the interior points are read
+        phi = f["opensbliblock00/phi_B0"][halo:nx+halo]
 
     # Grid spacing
     dx = 1.0/(nx)
 
     # Coordinate array
-    x = numpy.zeros(nx)
-    phi_initial = numpy.zeros(nx)
-    phi_analytical = numpy.zeros(nx)
-    phi_error = numpy.zeros(nx)
-
+    x = numpy.arange(nx, dtype=numpy.float64)*dx
+    # Initial condition
+    phi_initial = numpy.sin(2*pi*x)
+    # Analytical solution
+    phi_analytical = numpy.sin(2*pi*(x+0.5))  # Phi should be a sin wave shifted to the right by x = 0.5 (since the wave speed is 0.5 m/s and we've simulated until T = 1.0 s).
     # Compute the error
-    for i in range(0, nx):
-        x[i] = i*dx
-        # Initial condition
-        phi_initial[i] = sin(2*pi*x[i])
-        # Analytical solution
-        phi_analytical[i] = sin(2*pi*(x[i]+0.5))  # Phi should be a sin wave shifted to the right by x = 0.5 (since the wave speed is 0.5 m/s and we've simulated until T = 1.0 s).
-        phi_error[i] = abs(phi_analytical[i] - phi[i])
+    phi_error = numpy.abs(phi_analytical - phi)
 
     plt.clf()
 
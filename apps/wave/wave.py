@@ -21,7 +21,6 @@
 # Import all the functions from opensbli
 from opensbli import *
 import copy
-from opensbli.utilities.helperfunctions import substitute_simulation_parameters
 
 # Problem dimension
 ndim = 1
@@ -87,8 +86,7 @@ block.discretise()
 # Algorithm for the block
 alg = TraditionalAlgorithmRK(block)
 SimulationDataType.set_datatype(Double)
-OPSC(alg)
 
 constants = ['c0', 'dt', 'niter', 'block0np0', 'Delta0block0']
 values = ['0.5', '0.001', '1.0/0.001', '200', '1.0/block0np0']
-substitute_simulation_parameters(constants, values)
+OPSC(alg, simulation_parameters=dict(zip(constants, values)))
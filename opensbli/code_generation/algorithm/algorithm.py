@@ -357,9 +357,16 @@ class TraditionalAlgorithmRK(object):
     which gives user control to do any modifications for extra functionality that
     is to be performed like, doing some post processing for every time loop or
     sub rk loop
+
+    :arg blocks: The simulation block.
+    :arg str dtype: The data type of the simulation, defaults to double.
+    :arg bool latex_output: Write the algorithm to latex_output/algorithm.tex. Typesetting every equation is more
+        expensive than generating the code for it, so this can be disabled for large problems.
+    :arg bool fuse_kernels: Fuse the consecutive spatial and temporal advance kernels of the Runge-Kutta stage that can be
+        evaluated in a single loop, see Kernel.can_fuse. This reduces the number of loops over the grid in each stage.
     """
 
-    def __init__(self, blocks, dtype=None):
+    def __init__(self, blocks, dtype=None, latex_output=True, fuse_kernels=False):
         from opensbli.core.block import SimulationBlock as SB
         self.block_descriptions = []
         self.ntimers = 0
@@ -374,6 +381,8 @@ class TraditionalAlgorithmRK(object):
         else:
             # TODO V2 import Double datatype
             self.dtype = "double"
+        self.latex_output = latex_output
+        self.fuse_kernels = fuse_kernels
         self.check_temporal_scheme(blocks)
         self.prg = MainPrg()
         self.add_block_names(blocks)
@@ -401,17 +410,15 @@ class TraditionalAlgorithmRK(object):
             defdecs.add_components(b.block_stencils.values())
         return defdecs
 
-    def comapre_no_sims(self, s1, s2):
-        return cmp(s1.order, s2.order)
-
     def generate_solution(self, blocks):
         """ Generates the solution for the block
         """
         from opensbli.equation_types.opensbliequations import SimulationEquations, NonSimulationEquations, ConstituentRelations
-        print("Generating algorithm and writing latex of it")
-        fname = 'algorithm.tex'
-        latex = LatexWriter()
-        latex.open(fname, "Algorithm for the equations")
+        from opensbli.core.kernel import fuse_kernels
+        if self.latex_output:
+            print("Generating algorithm and writing latex of it")
+        else:
+            print("Generating algorithm")
         if self.MultiBlock:
             raise NotImplementedError("")
         else:
@@ -430,7 +437,7 @@ class TraditionalAlgorithmRK(object):
                 raise ValueError("Found more than one temporal scheme on the \
                     block")
             for scheme in b.get_temporal_schemes:
-                for key, value in scheme.solution.iteritems():
+                for key, value in scheme.solution.items():
                     if isinstance(key, SimulationEquations):
                         # Solution advancement kernels
                         temporal_start += scheme.solution[key].start_kernels
@@ -444,7 +451,7 @@ class TraditionalAlgorithmRK(object):
                         if not isinstance(key, ConstituentRelations):
                             print("NOT classified", type(key))
                             raise ValueError("Equations class can not be classified: %s" % key)
-            for key in sorted(non_simulation_eqs, cmp=self.comapre_no_sims):
+            for key in sorted(non_simulation_eqs, key=lambda eq: eq.order):
                 for place in key.algorithm_place:
                     if isinstance(place, BeforeSimulationStarts):
                         before_time += key.Kernels
@@ -457,7 +464,11 @@ class TraditionalAlgorithmRK(object):
                             in_time += key.Kernels
 
             sc = b.get_temporal_schemes[0]
-            innerloop = sc.generate_inner_loop(spatial_kernels + inner_temporal_advance_kernels + bc_kernels)
+            stage_kernels = spatial_kernels + inner_temporal_advance_kernels
+            if self.fuse_kernels:
+                # The boundary kernels are also evaluated before the time loop, so they are not fused
+                stage_kernels = fuse_kernels(stage_kernels, b)
+            innerloop = sc.generate_inner_loop(stage_kernels + bc_kernels)
             # Add BC kernels to temporal start
             temporal_start = bc_kernels + temporal_start
             temporal_iteration = sc.temporal_iteration
@@ -482,6 +493,7 @@ class TraditionalAlgorithmRK(object):
                     else:
                         raise NotImplementedError("In Non-simulation equations")
             tloop = DoLoop(temporal_iteration)
+            self.temporal_loop = tloop
             tloop.add_components(temporal_start)
             tloop.add_components(innerloop)
             tloop.add_components(in_time)
@@ -490,8 +502,11 @@ class TraditionalAlgorithmRK(object):
             self.prg.add_components(before_time)
             self.prg.add_components(timed_tloop)
             self.prg.add_components(after_time)
-            self.prg.write_latex(latex)
-        latex.close()
+            if self.latex_output:
+                latex = LatexWriter()
+                latex.open('algorithm.tex', "Algorithm for the equations")
+                self.prg.write_latex(latex)
+                latex.close()
         return
 
     def add_timers(self, components):
@@ -27,12 +27,12 @@ from sympy.core.compatibility import is_sequence
 from sympy.printing.ccode import C99CodePrinter
 from sympy.core.relational import Equality
 from opensbli.core.opensbliobjects import ConstantObject, ConstantIndexed, Constant, DataSetBase, GroupedPiecewise
-from sympy import Symbol, flatten
-from opensbli.core.grid import GridVariable
+from sympy import Symbol, flatten, S
 from opensbli.core.datatypes import SimulationDataType
-from sympy import Pow, Idx
+from sympy import Pow, Idx, pprint
 
 import os
+import re
 import logging
 LOG = logging.getLogger(__name__)
 BUILD_DIR = os.getcwd()
@@ -51,9 +51,10 @@ class RationalCounter():
         self.rational_counter = self.rational_counter + 1
         return
 
-    def get_next_rational_constant(self, numerical_value):
+    def get_next_rational_constant(self, numerical_value, name=None):
+        """ Creates the next constant for the value, the name defaults to the rational constant name."""
         from opensbli.core.kernel import ConstantsToDeclare
-        name = self.name % self.rational_counter
+        name = (name or self.name) % self.rational_counter
         self.increase_rational_counter
         ret = ConstantObject(name)
         ret.value = numerical_value
@@ -70,11 +71,13 @@ class OPSCCodePrinter(C99CodePrinter):
     """ Prints OPSC code. """
     dataset_accs_dictionary = {}
     settings_opsc = {'rational': False, 'kernel': False}
+    # Printed rationals, keyed on the numerator and denominator
+    _rational_cache = {}
 
     def __init__(self, settings={}):
         """ Initialise the code printer. """
         self.settings_opsc = settings
-        if 'rational' in settings.keys():
+        if 'rational' in settings:
             self.settings_opsc = settings
         else:
             self.settings_opsc['rational'] = False
@@ -89,8 +92,10 @@ class OPSCCodePrinter(C99CodePrinter):
         at the start of the program, to reduce divisions
         """
         if self.settings_opsc.get('rational', True):
-            p, q = int(expr.p), int(expr.q)
-            return '%d.0/%d.0' % (p, q)
+            key = (expr.p, expr.q)
+            if key not in self._rational_cache:
+                self._rational_cache[key] = '%d.0/%d.0' % (int(expr.p), int(expr.q))
+            return self._rational_cache[key]
         else:
             if expr in rc.existing:
                 return self._print(rc.existing[expr])
@@ -145,11 +150,10 @@ class OPSCCodePrinter(C99CodePrinter):
         """Prints the OpenSBLI dataset in the OPS format with the access numbers provided.
         Access numbers are updated for each kernel, see writing kernel in the OPSC class
         """
-        base = expr.base
-        if self.dataset_accs_dictionary[base]:
-            indices = expr.get_grid_indices
-            out = "%s[%s(%s)]" % (self._print(base), self.dataset_accs_dictionary[base].name, ','.join([self._print(i) for i in indices]))
-            return out
+        # The dataset name and OPS access of each datasetbase are formatted once per kernel
+        access = self.dataset_accs_dictionary.get(expr.base)
+        if access:
+            return "%s%s)]" % (access, ','.join(map(self._print, expr.get_grid_indices)))
         else:
             raise ValueError("Did not find the OPS Access for %s " % expr.base)
 
@@ -160,10 +164,9 @@ class OPSCCodePrinter(C99CodePrinter):
         :returns: The indexed expression, as OPSC code.
         :rtype: str
         """
-        indices = [ind for ind in expr.indices]
-        for number, index in enumerate(indices):
-            for sym in index.atoms(Symbol):
-                indices[number] = indices[number].subs({sym: 0})
+        # The symbols in the indices are set to zero in a single pass over each index
+        zero_map = {sym: S.Zero for index in expr.indices for sym in index.atoms(Symbol)}
+        indices = [index.xreplace(zero_map) for index in expr.indices]
         out = "%s[%s]" % (self._print(expr.base.label), ','.join([self._print(index) for index in indices]))
         return out
 
@@ -195,33 +198,90 @@ def pow_to_constant(expr):
                 inverse_terms[at] = rc.existing[at]
             else:
                 inverse_terms[at] = rc.get_next_rational_constant(at)
-    expr = expr.subs(inverse_terms)
+    expr = expr.xreplace(inverse_terms)
     rc.name = orig_name  # change it back to the original name of Rational counter
     return expr
 
 
-def ccode(expr, settings={}):
+# Code printers for each of the settings used, the dataset accesses are read from the
+# OPSCCodePrinter class at print time so a printer can be reused across kernels
+_printers = {}
+
+
+def _get_printer(settings):
+    """ Returns the stored OPSCCodePrinter for the settings, creating it on the first use."""
+    key = tuple(sorted(settings.items()))
+    if key not in _printers:
+        _printers[key] = OPSCCodePrinter(settings)
+    return _printers[key]
+
+
+def ccode(expr, settings={}, printer=None):
     """ Create an OPSC code printer object and write out the expression as an OPSC code string.
 
     :arg expr: The expression to translate into OPSC code.
-    :arg Indexed_accs: Indexed OPS_ACC accesses.
-    :arg constants: Constants that should be defined at the top of the OPSC code.
+    :arg dict settings: Settings for the OPSC code printer.
+    :arg printer: An existing OPSCCodePrinter to write the expression, if None the printer for the settings is used.
     :returns: The expression in OPSC code.
     :rtype: str
     """
     if isinstance(expr, Equality):
-        if 'rational' in settings.keys():
+        if 'rational' in settings:
             pass
         else:
             expr = pow_to_constant(expr)
-        code_print = OPSCCodePrinter(settings)
-        code = code_print.doprint(expr.lhs) \
-            + ' = ' + OPSCCodePrinter(settings).doprint(expr.rhs)
-        if isinstance(expr.lhs, GridVariable):
-            code = code
+        code_print = printer or _get_printer(settings)
+        code = code_print.doprint(expr.lhs) + ' = ' + code_print.doprint(expr.rhs)
         return code
     else:
-        return OPSCCodePrinter(settings).doprint(expr)
+        code_print = printer or _get_printer(settings)
+        return code_print.doprint(expr)
+
+
+def _same_content(text, chunks):
+    """ Compares the text with the chunks of code in order, without joining the chunks."""
+    position = 0
+    for chunk in chunks:
+        if text[position:position + len(chunk)] != chunk:
+            return False
+        position += len(chunk)
+    return position == len(text)
+
+
+def write_file(path, content):
+    """ Writes the generated code to a file. An existing file with the same contents is not rewritten, so that
+    its modification time is kept and build systems do not recompile unchanged code.
+
+    :arg str path: The path of the file.
+    :arg content: The code to write, either a string or a list of strings that are written one after the other.
+    :returns: True if the file was written, False if it was unchanged.
+    :rtype: bool
+    """
+    chunks = content if isinstance(content, list) else [content]
+    if os.path.isfile(path):
+        with open(path, 'r') as f:
+            if _same_content(f.read(), chunks):
+                return False
+    with open(path, 'w') as f:
+        f.writelines(chunks)
+    return True
+
+
+def substitute_input_constants(code, substitutions):
+    """ Substitutes the numerical values of the input constants, written as 'name=Input;' in the main program.
+
+    :arg str code: The code of the main program.
+    :arg dict substitutions: The values keyed on the constant names.
+    :returns: The code with the values substituted.
+    :rtype: str
+    """
+    print("Constant simulation values:")
+    pprint(substitutions)
+    # Substitute all of the input constants in a single pass over the code
+    if substitutions:
+        pattern = re.compile(r"\b(%s)=Input;" % '|'.join(re.escape(const) for const in substitutions))
+        code = pattern.sub(lambda match: match.group(1) + ' = %s' % substitutions[match.group(1)] + ';', code)
+    return code
 
 
 class WriteString(object):
@@ -242,7 +302,8 @@ class WriteString(object):
 
     @property
     def opsc_code(self):
-        return ['\n'.join(self.components)]
+        # The lines are joined once, when the code is written to file
+        return list(self.components)
 
 
 class OPSAccess(object):
@@ -251,6 +312,10 @@ class OPSAccess(object):
         return
 
 
+# Indenting does not depend on any printer settings, so a single printer is used
+_indent_printer = C99CodePrinter()
+
+
 def indent_code(code_lines):
     """ Indent the code.
 
@@ -258,33 +323,42 @@ def indent_code(code_lines):
     :returns: A list of the indented line(s) of code.
     :rtype: list
     """
-
-    p = C99CodePrinter()
-    return p.indent_code(code_lines)
+    return _indent_printer.indent_code(code_lines)
 
 
 class OPSC(object):
 
     ops_headers = {'input': "const %s *%s", 'output': '%s *%s', 'inout': '%s *%s'}
 
-    def __init__(self, algorithm):
-        """ Generating an OPSC code from the algorithm"""
+    def __init__(self, algorithm, loop_chain=False, simulation_parameters=None):
+        """ Generating an OPSC code from the algorithm
+
+        :arg algorithm: The algorithm of the simulation.
+        :arg bool loop_chain: Execute the kernels of each time step as a single loop chain, see loop_chain_open.
+        :arg dict simulation_parameters: Values of the input constants keyed on the constants or their names. The values
+        are substituted before the main program is written, so it is only written once, see substitute_input_constants."""
         if not algorithm.MultiBlock:
             self.MultiBlock = False
             self.dtype = algorithm.dtype
+            # Names of the kernel functions written, keyed on the equations and arguments of the kernel
+            self._kernel_functions = {}
             # First write the kernels, with this we will have the Rational constants to declare
             self.write_kernels(algorithm)
+            if loop_chain:
+                tloop = algorithm.temporal_loop
+                tloop.components = self.loop_chain_open() + tloop.components + self.loop_chain_close()
             def_decs = self.opsc_def_decs(algorithm)
             end = self.ops_exit()
             algorithm.prg.components = def_decs + algorithm.prg.components + end
             code = algorithm.prg.opsc_code
             code = self.before_main(algorithm) + code
             self.name = 'taylor_green_vortex'
-            f = open('opensbli.cpp', 'w')
             # code = indent_code(code)
-            f.write('\n'.join(code))
-            f.close()
-            print "Successfully generated OPS C code"
+            code = '\n'.join(code)
+            if simulation_parameters is not None:
+                code = substitute_input_constants(code, {str(const): value for const, value in simulation_parameters.items()})
+            write_file('opensbli.cpp', code)
+            print("Successfully generated OPS C code")
         return
 
     def wrap_long_lines(self, code_lines):
@@ -326,34 +400,29 @@ class OPSC(object):
         return formatted_code
 
     def kernel_header(self, tuple_list):
-        code = []
         dtype = SimulationDataType.opsc()
-        for key, val in (tuple_list):
+        # The simulation data type is filled in once, for the arguments without their own datatype
+        default_headers = {val: header % (dtype, '%s') for val, header in self.ops_headers.items()}
+        code = []
+        for key, val in tuple_list:
             # if any of the list has the datatype then use the data type
             if hasattr(key, "datatype") and key.datatype:
                 code += [self.ops_headers[val] % (key.datatype.opsc(), key)]
             else:
-                code += [self.ops_headers[val] % (dtype, key)]
+                code += [default_headers[val] % key]
         code = ', '.join(code)
         return code
 
     def kernel_computation_opsc(self, kernel):
-        ins = kernel.rhs_datasetbases
-        outs = kernel.lhs_datasetbases
-        inouts = ins.intersection(outs)
-        ins = ins.difference(inouts)
-        outs = outs.difference(inouts)
-        # eqs = kernel.equations
-        all_dataset_inps = list(ins) + list(outs) + list(inouts)
-        all_dataset_types = ['input' for i in ins] + ['output' for o in outs] + ['inout' for io in inouts]
+        ins, outs, inouts = kernel.dataset_accesses
         # add the global variables to the inputs and outputs
         global_ins, global_outs = kernel.global_variables
         if global_ins.intersection(global_outs):
             raise NotImplementedError("Input output of global variables is not implemented")
-        all_dataset_inps += list(global_ins) + list(global_outs)
-        all_dataset_types += ['input' for i in global_ins] + ['output' for o in global_outs]
-        # Use list of tuples as dictionary messes the order
-        header_dictionary = zip(all_dataset_inps, all_dataset_types)
+        # Use list of tuples as dictionary messes the order, the arguments are collected in a single pass
+        header_dictionary = [(d, access) for inputs, access in [(ins, 'input'), (outs, 'output'), (inouts, 'inout'),
+                                                                (global_ins, 'input'), (global_outs, 'output')] for d in inputs]
+        all_dataset_inps = [d for d, access in header_dictionary]
         if kernel.IndexedConstants:
             for i in kernel.IndexedConstants:
                 header_dictionary += [tuple([(i.base), 'input'])]
@@ -364,45 +433,60 @@ class OPSC(object):
         else:
             other_inputs = ''
         # print header_dictionary
-        code = ["void %s(" % kernel.kernelname + self.kernel_header(header_dictionary) + other_inputs + ')' + '\n{']
+        # Kernels with the same equations and arguments only differ in their range, so they are evaluated by the
+        # function of the first kernel and no code is returned
+        key = (tuple(kernel.equations), tuple(header_dictionary), other_inputs)
+        if key in self._kernel_functions:
+            kernel.function_name = self._kernel_functions[key]
+            return []
+        self._kernel_functions[key] = kernel.function_name
+        code = ["void %s(" % kernel.function_name + self.kernel_header(header_dictionary) + other_inputs + ')' + '\n{']
         ops_accs = [OPSAccess(no) for no in range(len(all_dataset_inps))]
-        OPSCCodePrinter.dataset_accs_dictionary = dict(zip(all_dataset_inps, ops_accs))
-        # Find all the grid variables and declare them at the top
-        gridvariables = set()
+        OPSCCodePrinter.dataset_accs_dictionary = {d: "%s[%s(" % (d, acc.name) for d, acc in zip(all_dataset_inps, ops_accs)}
+        # A single printer is used to write all the equations in the kernel
+        settings = {'kernel': True}
+        printer = _get_printer({'kernel': True})
+        # The OPS_ACC accesses are fixed for this kernel, so repeated expressions are printed once
+        printed = {}
+
+        def kernel_ccode(expr):
+            if expr not in printed:
+                printed[expr] = ccode(expr, settings=settings, printer=printer)
+            return printed[expr]
         out = []
         for eq in kernel.equations:
-            gridvariables = gridvariables.union(eq.atoms(GridVariable))
             if isinstance(eq, Equality):
-                out += [ccode(eq, settings={'kernel': True}) + ';\n']
+                out += [kernel_ccode(eq) + ';\n']
             elif isinstance(eq, GroupedPiecewise):
                 for i, (expr, condition) in enumerate(eq.args):
                     if i == 0:
-                        out += ['if (%s)' % ccode(condition, settings={'kernel': True}) + '{\n']
+                        out += ['if (%s)' % kernel_ccode(condition) + '{\n']
                         if is_sequence(expr):
                             for eqn in expr:
-                                out += [ccode(eqn, settings={'kernel': True}) + ';\n']
+                                out += [kernel_ccode(eqn) + ';\n']
                         else:
-                            out += [ccode(expr, settings={'kernel': True}) + ';\n']
+                            out += [kernel_ccode(expr) + ';\n']
                         out += ['}\n']
                     elif condition is not True:
-                        out += ['else if (%s)' % ccode(condition, settings={'kernel': True}) + '{\n']
+                        out += ['else if (%s)' % kernel_ccode(condition) + '{\n']
                         if is_sequence(expr):
                             for eqn in expr:
-                                out += [ccode(eqn, settings={'kernel': True}) + ';\n']
+                                out += [kernel_ccode(eqn) + ';\n']
                         else:
-                            out += [ccode(expr, settings={'kernel': True}) + ';\n']
+                            out += [kernel_ccode(expr) + ';\n']
                         out += ['}\n']
                     else:
                         out += ['else{\n']
                         if is_sequence(expr):
                             for eqn in expr:
-                                out += [ccode(eqn, settings={'kernel': True}) + ';\n']
+                                out += [kernel_ccode(eqn) + ';\n']
                         else:
-                            out += [ccode(expr, settings={'kernel': True}) + ';\n']
+                            out += [kernel_ccode(expr) + ';\n']
                         out += ['}\n']
             else:
                 raise TypeError("Unclassified type of equation.")
-        for gv in gridvariables:
+        # Declare all the grid variables at the top
+        for gv in kernel.grid_variables:
             code += ["%s %s = 0.0;" % (SimulationDataType.opsc(), str(gv))]
         code += out + ['}']  # close Kernel
         OPSCCodePrinter.dataset_accs_dictionary = {}
@@ -411,21 +495,45 @@ class OPSC(object):
     def write_kernels(self, algorithm):
         from opensbli.core.kernel import Kernel
         kernels = self.loop_alg(algorithm, Kernel)
-        files = [open('%s_kernels.h' % b.block_name, 'w') for b in algorithm.block_descriptions]
-        for f in files:
+        # The kernel names are the C function names, so two different kernels cannot share a name
+        kernel_names = {}
+        for k in kernels:
+            if kernel_names.setdefault(k.kernelname, k) is not k:
+                raise ValueError("Kernel name %s is used by more than one kernel." % k.kernelname)
+        files = []
+        for b in algorithm.block_descriptions:
             name = ('%s_kernel_H' % b.block_name).upper()
-            f.write('#ifndef %s\n' % name)
-            f.write('#define %s\n' % name)
+            files += [['#ifndef %s\n' % name, '#define %s\n' % name]]
         for k in kernels:
-            out = self.kernel_computation_opsc(k) + ['\n']
-            out = indent_code(out)
+            out = self.kernel_computation_opsc(k)
+            if not out:
+                continue
+            out = indent_code(out + ['\n'])
             out = self.wrap_long_lines(out)
-            files[k.block_number].write('\n'.join(out))
-        for f in files:
-            f.write("#endif\n")
-        files = [f.close() for f in files]
+            files[k.block_number] += ['\n'.join(out)]
+        for b, contents in zip(algorithm.block_descriptions, files):
+            write_file('%s_kernels.h' % b.block_name, contents + ["#endif\n"])
         return
 
+    def loop_chain_open(self):
+        """ OPS queues the ops_par_loops and executes them when the data is required on the host, with the lazy
+        execution enabled by the OPS_TILING runtime argument the queued loops are tiled using their iteration ranges
+        and stencils. The time step is the loop chain, the loops are queued from the start of the time step.
+
+        :returns: The code starting the loop chain.
+        :rtype: list
+        """
+        return [WriteString('// Queue the kernels of the time step as a loop chain')]
+
+    def loop_chain_close(self):
+        """ Executes the queued loops at the end of the time step, this does nothing without the lazy execution
+        so the code also runs on the backends without tiling.
+
+        :returns: The code closing the loop chain.
+        :rtype: list
+        """
+        return [WriteString('// Execute the loop chain of the time step'), WriteString('ops_execute();')]
+
     def ops_exit(self):
         return [WriteString("ops_exit();")]
 
@@ -469,14 +577,15 @@ class OPSC(object):
             output += self.declare_block(b)
         # output += defs + decls
         # Define and declare datasets on each block
-        f = open('defdec_data_set.h', 'w')
         datasets_dec = []
         output += [WriteString("#include \"defdec_data_set.h\"")]
         for d in algorithm.defnitionsdeclarations.components:
             if isinstance(d, DataSetBase):
                 datasets_dec += self.declare_dataset(d)
-        f.write('\n'.join(flatten([d.opsc_code for d in datasets_dec])))
-        f.close()
+        dataset_code = []
+        for d in datasets_dec:
+            dataset_code.extend(d.opsc_code)
+        write_file('defdec_data_set.h', '\n'.join(dataset_code))
         output += [WriteString("// Define and declare stencils")]
         from opensbli.core.kernel import StencilObject
         for d in algorithm.defnitionsdeclarations.components:
@@ -487,13 +596,12 @@ class OPSC(object):
         from opensbli.core.bcs import Exchange
         exchange_list = self.loop_alg(algorithm, Exchange)
         if exchange_list:
-            f = open('bc_exchanges.h', 'w')  # write BC_exchange code to a separate file
             exchange_code = []
             for e in exchange_list:
                 call, code = self.bc_exchange_call_code(e)
                 exchange_code += [code]
-            f.write('\n'.join(flatten(exchange_code)))
-            f.close()
+            # write BC_exchange code to a separate file
+            write_file('bc_exchanges.h', '\n'.join(flatten(exchange_code)))
             output += [WriteString("#include \"bc_exchanges.h\"")]  # Include statement in the code
         output += self.ops_partition()
 
@@ -504,7 +612,7 @@ class OPSC(object):
         dtype = s.dtype.opsc()
         name = s.name + 'temp'
         sorted_stencil = s.sort_stencil_indices()
-        out = [self.declare_inline_array(dtype, name, [st for st in flatten(sorted_stencil) if not isinstance(st, Idx)])]
+        out = [self.declare_inline_array(dtype, name, [st for point in sorted_stencil for st in point if not isinstance(st, Idx)])]
         out += [WriteString('ops_stencil %s = ops_decl_stencil(%d,%d,%s,\"%s\");' % (s.name, s.ndim, len(s.stencil), name, name))]
         return out
 
@@ -526,12 +634,8 @@ class OPSC(object):
         :rtype: list
         """
         out = [WriteString('// Initializing OPS ')]
-        if diagnostics_level:
-            self.ops_diagnostics = True
-            return out + [WriteString('ops_init(argc,argv,%d);' % (diagnostics_level))]
-        else:
-            self.ops_diagnostics = False
-            return out + [WriteString('ops_init(argc,argv,%d);' % (1))]
+        self.ops_diagnostics = bool(diagnostics_level)
+        return out + [WriteString('ops_init(argc,argv,%d);' % (diagnostics_level or 1))]
 
     def Exchange_code(self, e):
         # out =
@@ -547,14 +651,13 @@ class OPSC(object):
         code = ['// Boundary condition exchange code on %s direction %s %s' % (instance.block_name, instance.direction, instance.side)]
         code += ['ops_halo_group %s %s' % (name, ";")]
         code += ["{"]
-        code += ['int halo_iter[] = {%s}%s' % (', '.join([str(s) for s in instance.transfer_size]), ";")]
-        code += ['int from_base[] = {%s}%s' % (', '.join([str(s) for s in instance.transfer_from]), ";")]
-        code += ['int to_base[] = {%s}%s' % (', '.join([str(s) for s in instance.transfer_to]), ";")]
+        code += ['int halo_iter[] = {%s}%s' % (', '.join(map(str, instance.transfer_size)), ";")]
+        code += ['int from_base[] = {%s}%s' % (', '.join(map(str, instance.transfer_from)), ";")]
+        code += ['int to_base[] = {%s}%s' % (', '.join(map(str, instance.transfer_to)), ";")]
         # dir in OPSC. WARNING: Not sure what it is, but 1 to ndim works.
-        from_dir = [ind+1 for ind in range(len(instance.transfer_to))]
-        to_dir = [ind+1 for ind in range(len(instance.transfer_to))]
-        code += ['int from_dir[] = {%s}%s' % (', '.join([str(ind) for ind in from_dir]), ";")]
-        code += ['int to_dir[] = {%s}%s' % (', '.join([str(ind) for ind in to_dir]), ";")]
+        directions = ', '.join(map(str, range(1, len(instance.transfer_to)+1)))
+        code += ['int from_dir[] = {%s}%s' % (directions, ";")]
+        code += ['int to_dir[] = {%s}%s' % (directions, ";")]
         # Process the arrays
         for no, arr in enumerate(instance.transfer_arrays):
             from_array = instance.from_arrays[no]
@@ -562,7 +665,7 @@ class OPSC(object):
             code += ['ops_halo %s%d = ops_decl_halo(%s, %s, halo_iter, from_base, to_base, from_dir, to_dir)%s'
                      % (halo, off, from_array.base, to_array.base, ";")]
             off = off+1
-        code += ['ops_halo grp[] = {%s}%s' % (','.join([str('%s%s' % (halo, of)) for of in range(off)]), ";")]
+        code += ['ops_halo grp[] = {%s}%s' % (','.join('%s%d' % (halo, of) for of in range(off)), ";")]
         code += ['%s = ops_decl_halo_group(%d,grp)%s' % (name, off, ";")]
         code += ["}"]
         # Finished OPS halo exchange, now get the call
@@ -629,44 +732,31 @@ class OPSC(object):
             else:
                 raise NotImplementedError("")
         else:
-            print c
+            print(c)
             raise ValueError("")
 
     def declare_ops_constants(self, c):
         if isinstance(c, ConstantObject):
-            return [WriteString("ops_decl_const(\"%s\" , 1, \"%s\", &%s);" % (str(c), c.datatype.opsc(), str(c)))]
+            name = str(c)
+            return [WriteString("ops_decl_const(\"%s\" , 1, \"%s\", &%s);" % (name, c.datatype.opsc(), name))]
         elif isinstance(c, ConstantIndexed):
             return []
         return
 
     def declare_inline_array(self, dtype, name, values):
-        return WriteString('%s %s[] = {%s};' % (dtype, name, ', '.join([str(s) for s in values])))
+        return WriteString('%s %s[] = {%s};' % (dtype, name, ', '.join(map(str, values))))
 
     def update_inline_array(self, name, values):
-        out = []
-        for no, v in enumerate(values):
-            out += [WriteString("%s[%d] = %s;" % (name, no, v))]
-        return out
+        return [WriteString("%s[%d] = %s;" % (name, no, v)) for no, v in enumerate(values)]
 
     def define_dataset(self, dset):
         if not self.MultiBlock:
             return [WriteString("ops_dat %s;" % (dset))]
 
     def get_max_halos(self, halos):
-        halo_m = []
-        halo_p = []
-        for direction in range(len(halos)):
-            if halos[direction][0]:
-                hal = [d.get_halos(0) for d in halos[direction][0]]
-                halo_m += [min(hal)]
-            else:
-                halo_m += [0]
-            if halos[direction][1]:
-                hal = [d.get_halos(1) for d in halos[direction][1]]
-                halo_p += [max(hal)]
-            else:
-                halo_p += [0]
-        return halo_m, halo_p
+        """ Returns the halos of a dataset in each direction, these are the same as the kernel halo values."""
+        from opensbli.utilities.helperfunctions import get_min_max_halo_values
+        return get_min_max_halo_values(halos)
 
     def declare_dataset(self, dset):
         declaration = WriteString("ops_dat %s;" % dset)
@@ -685,8 +775,8 @@ class OPSC(object):
             hm, hp = self.get_max_halos(dset.halo_ranges)
             halo_p = self.declare_inline_array("int", "halo_p", hp)
             halo_m = self.declare_inline_array("int", "halo_m", hm)
-            sizes = self.declare_inline_array("int", "size", [str(s) for s in (dset.size)])
-            base = self.declare_inline_array("int", "base", [0 for i in range(len(dset.size))])
+            sizes = self.declare_inline_array("int", "size", dset.size)
+            base = self.declare_inline_array("int", "base", [0]*len(dset.size))
             value = WriteString("%s* value = NULL;" % dtype.opsc())
             temp = '%s = ops_decl_dat(%s, 1, size, base, halo_m, halo_p, value, \"%s\", \"%s\");' % (dset,
                                                                                                      dset.block_name, dtype.opsc(), dset)
@@ -77,7 +77,7 @@ class iohdf5(opensbliIO):
             else:
                 fname = 'data.h5'
             for ar in cls.arrays:
-                if str(ar) in block.block_datasets.keys():
+                if str(ar) in block.block_datasets:
                     dset = block.block_datasets[str(ar)]
                     dset.read_from_hdf5 = True
                     dset.input_file_name = fname
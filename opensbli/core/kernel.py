@@ -24,7 +24,7 @@
 """
 
 from sympy import flatten, Equality, Indexed
-from sympy import Rational, Pow, Integer
+from sympy import Rational, Pow, Integer, preorder_traversal
 from opensbli.core.opensbliobjects import DataSet, ConstantIndexed, ConstantObject,\
     GlobalValue, GroupedPiecewise, Constant
 from opensbli.equation_types.opensbliequations import OpenSBLIEq
@@ -33,24 +33,28 @@ from opensbli.core.datatypes import SimulationDataType
 from sympy.core.function import _coeff_isneg
 from opensbli.utilities.helperfunctions import get_min_max_halo_values, dataset_attributes
 from opensbli.core.datatypes import Int
-import copy
+from collections import defaultdict
 
 _known_equation_types = (GroupedPiecewise, OpenSBLIEq)
 
 
 class ConstantsToDeclare(object):
     constants = []
+    # Set of the constants, kept in sync with the list for membership tests
+    _index = set()
 
     @staticmethod
     def add_constant(constant, value=None, dtype=None):
         """ Adds a constant or list of constants to be declared in the final program."""
         if isinstance(constant, Constant):
-            if constant not in ConstantsToDeclare.constants:
+            if constant not in ConstantsToDeclare._index:
                 ConstantsToDeclare.constants += [constant]
+                ConstantsToDeclare._index.add(constant)
         elif isinstance(constant, list):
             for c in constant:
-                if c not in ConstantsToDeclare.constants:
+                if c not in ConstantsToDeclare._index:
                     ConstantsToDeclare.constants += [c]
+                    ConstantsToDeclare._index.add(c)
         else:
             raise ValueError("Unknown type of constant")
         return
@@ -64,20 +68,30 @@ def copy_block_attributes(block, otherclass):
     return
 
 
+def initialise_block_dataset(dset, block, halos):
+    """ Sets the datasetbase attributes of a dataset declared on the block, each side in
+    every direction gets its own copy of the scheme halos."""
+    dset = dataset_attributes(dset)
+    dset.size = block.shape
+    dset.block_number = block.blocknumber
+    dset.halo_ranges = [[set(halos), set(halos)] for direction in range(block.ndim)]
+    dset.block_name = block.blockname
+    return dset
+
+
 class StencilObject(object):
     def __init__(self, name, stencil, ndim):
         self.name = name
         self.stencil = stencil
         self.ndim = ndim
         self.dtype = Int()
+        # Tuples compare lexicographically, so a single sort orders the stencil points
+        self.sorted_stencil = sorted(stencil, key=tuple)
         return
 
     def sort_stencil_indices(self):
-        """ Helper function for relative_stencil, used in OPSC. Sorts the relative stencil locations."""
-        index_set = self.stencil
-        dim = len(list(index_set)[0])
-        sorted_index_set = sorted(index_set, key=lambda tup: tuple(tup[i] for i in range(dim)))
-        return sorted_index_set
+        """ Helper function for relative_stencil, used in OPSC. Returns the sorted relative stencil locations."""
+        return self.sorted_stencil
 
 
 class Kernel(object):
@@ -91,9 +105,16 @@ class Kernel(object):
         self.computation_name = computation_name
         self.kernel_no = block.kernel_counter
         self.kernelname = self.block_name + "Kernel%03d" % self.kernel_no
+        # The C function evaluating the kernel, kernels with the same equations share the function of the first one
+        self.function_name = self.kernelname
         block.increase_kernel_counter
+        self._mhash = None
         self.equations = []
+        # Atoms of the equations, populated lazily by _scan_equations
+        self._cache = {}
         self.halo_ranges = [[set(), set()] for d in range(block.ndim)]
+        # Halo types and the minimum and maximum halo values found from them, see _get_halo_mm
+        self._halo_mm = None
         return
 
     def set_computation_name(self, name):
@@ -102,12 +123,14 @@ class Kernel(object):
         return
 
     def __hash__(self):
-        h = hash(self._hashable_content())
-        self._mhash = h
+        h = self._mhash
+        if h is None:
+            h = hash(self._hashable_content())
+            self._mhash = h
         return h
 
     def _hashable_content(self):
-        return str(self.kernelname)
+        return self.kernelname
 
     def add_equation(self, equation):
         """ Add an equation or list of equations to be evaluated inside this computational kernel."""
@@ -121,20 +144,21 @@ class Kernel(object):
             pass
         else:
             raise ValueError("Error when adding equations to the kernel.")
+        self._cache = {}
         return
 
     def set_grid_range(self, block):
-        """ Sets the kernel range equal to the block ranges."""
-        self.ranges = copy.deepcopy(block.ranges)
+        """ Sets the kernel range equal to the block ranges. The range bounds are immutable
+        SymPy objects, so only the list for each direction is copied."""
+        self.ranges = [list(r) for r in block.ranges]
         return
 
     def set_halo_range(self, direction, side, types):
-        """ Sets the halo ranges for the kernel which extend beyond the grid range."""
-        if isinstance(types, set):
-            for s in types:
-                self.halo_ranges[direction][side].add(s)
-        else:
-            self.halo_ranges[direction][side].add(types)
+        """ Sets the halo ranges for the kernel which extend beyond the grid range. A new set is created rather than
+        updating in place, as the halo sets of the boundary condition kernels are shared with the block."""
+        if not isinstance(types, (set, frozenset)):
+            types = set([types])
+        self.halo_ranges[direction][side] = self.halo_ranges[direction][side] | types
         return
 
     def merge_halo_range(self, halo_range):
@@ -142,103 +166,163 @@ class Kernel(object):
         for direction in range(len(self.halo_ranges)):
             self.halo_ranges[direction][0] = self.halo_ranges[direction][0] | halo_range[direction][0]
             self.halo_ranges[direction][1] = self.halo_ranges[direction][1] | halo_range[direction][1]
-
         return
 
-    @property
-    def lhs_datasetbases(self):
-        datasets = set()
+    def can_fuse(self, other):
+        """ Checks if the other kernel can be evaluated in the same loop, directly after this kernel. The kernels
+        should be on the same block and iteration range, without reductions to global variables. Any dataset used by
+        both kernels should have the same stencil, and it should only be accessed at the grid point if it is
+        written by either kernel, so that no point depends on the result of another point in the fused loop.
+        Kernels with symbolic ranges or halos, e.g. split boundary kernels, can not be compared and are not fused."""
+        if self.block_number != other.block_number or not (hasattr(self, 'stencil_names') and hasattr(other, 'stencil_names')):
+            return False
+        if not (self.equations and other.equations) or self._scan_equations()['unknown'] or other._scan_equations()['unknown']:
+            return False
+        if any(self.global_variables + other.global_variables):
+            return False
+        first_stencils, second_stencils = self.get_stencils(), other.get_stencils()
+        written = self.lhs_datasetbases.union(other.lhs_datasetbases)
+        for dset in set(first_stencils).intersection(second_stencils):
+            if first_stencils[dset] != second_stencils[dset]:
+                return False
+            if dset in written and any(any(i != 0 for i in point) for point in first_stencils[dset]):
+                return False
+        for kernel in [self, other]:
+            if not hasattr(kernel, 'ranges') or isinstance(kernel.ranges, ConstantIndexed) or isinstance(kernel.halo_ranges, ConstantIndexed):
+                return False
+            if any(isinstance(h, ConstantIndexed) for halos in kernel.halo_ranges for side in halos for h in side):
+                return False
+        return self.ranges == other.ranges and self._get_halo_mm() == other._get_halo_mm()
+
+    def _get_halo_mm(self):
+        """ Returns the minimum and maximum halo values of the kernel in each direction. The values are stored with
+        the halo types they are found from and found again if the types have changed. The boundary condition kernels
+        share the halo sets of the block, which get the halos of the schemes discretised after them."""
+        types = [[frozenset(side) for side in halos] for halos in self.halo_ranges]
+        if self._halo_mm is None or self._halo_mm[0] != types:
+            self._halo_mm = (types, get_min_max_halo_values(self.halo_ranges))
+        return self._halo_mm[1]
+
+    def _scan_equations(self):
+        """ Walks the expression tree of each equation in the kernel once, collecting all the
+        atoms required by the kernel properties. The result is cached until a new equation is added."""
+        if self._cache:
+            return self._cache
+        lhs, rhs = set(), set()
+        unknown = []
+        rationals, inverses, consts, indexed_consts, global_vars = set(), set(), set(), set(), set()
+        datasets, grid_variables = set(), set()
+        grid_idx_used = False
         for eq in self.equations:
             if isinstance(eq, _known_equation_types):
-                datasets = datasets.union(eq.lhs_datasetbases)
+                lhs = lhs.union(eq.lhs_datasetbases)
+                rhs = rhs.union(eq.rhs_datasetbases)
+                eq_rationals, eq_consts, eq_indexed, eq_globals, eq_datasets, eq_gridvariables = set(), set(), set(), set(), set(), set()
+                for at in preorder_traversal(eq):
+                    if isinstance(at, Rational):
+                        eq_rationals.add(at)
+                    if isinstance(at, Pow):
+                        if _coeff_isneg(at.exp) and not (at.base.atoms(Indexed) or isinstance(at, GridVariable)):
+                            inverses.add(at)
+                    if isinstance(at, ConstantObject):
+                        eq_consts.add(at)
+                    if isinstance(at, ConstantIndexed):
+                        eq_indexed.add(at)
+                    if isinstance(at, GlobalValue):
+                        eq_globals.add(at)
+                    if isinstance(at, DataSet):
+                        eq_datasets.add(at)
+                    if isinstance(at, GridVariable):
+                        eq_gridvariables.add(at)
+                    if isinstance(at, Grididx):
+                        grid_idx_used = True
+                rationals = rationals.union(eq_rationals)
+                consts = consts.union(eq_consts)
+                indexed_consts = indexed_consts.union(eq_indexed)
+                global_vars = global_vars.union(eq_globals)
+                datasets = datasets.union(eq_datasets)
+                grid_variables = grid_variables.union(eq_gridvariables)
             elif isinstance(eq, Equality):
-                print eq
-                raise TypeError("Equality should be of types %s" % _known_equation_types)
-        return datasets
+                unknown += [eq]
+        # Integers are also being returned as Rational numbers, remove any integers
+        rationals = set([rc for rc in rationals if not isinstance(rc, Integer)])
+        self._cache.update({'lhs': lhs, 'rhs': rhs, 'unknown': unknown, 'rationals': rationals,
+                            'inverses': inverses, 'constants': consts, 'indexed_constants': indexed_consts,
+                            'global_variables': global_vars, 'datasets': datasets, 'grid_variables': grid_variables,
+                            'grid_indices_used': grid_idx_used})
+        return self._cache
+
+    def _check_equation_types(self):
+        unknown = self._scan_equations()['unknown']
+        if unknown:
+            print(unknown[0])
+            raise TypeError("Equality should be of types %s" % (_known_equation_types,))
+        return
+
+    @property
+    def lhs_datasetbases(self):
+        self._check_equation_types()
+        return self._scan_equations()['lhs']
 
     @property
     def rhs_datasetbases(self):
-        datasets = set()
-        for eq in self.equations:
-            if isinstance(eq, _known_equation_types):
-                datasets = datasets.union(eq.rhs_datasetbases)
-            elif isinstance(eq, Equality):
-                raise TypeError("Equality should be of types %s" % _known_equation_types)
-        return datasets
+        self._check_equation_types()
+        return self._scan_equations()['rhs']
+
+    @property
+    def dataset_accesses(self):
+        """ The datasetbases of the kernel split into the inputs, outputs and inputs that are also outputs.
+        These are used for both the kernel function and the ops_par_loop call, so the arguments are in the same order."""
+        cache = self._scan_equations()
+        if 'accesses' not in cache:
+            ins, outs = self.rhs_datasetbases, self.lhs_datasetbases
+            inouts = ins.intersection(outs)
+            cache['accesses'] = (ins.difference(inouts), outs.difference(inouts), inouts)
+        return cache['accesses']
 
     @property
     def Rational_constants(self):
-        rcs = set()
-        for eq in self.equations:
-            if isinstance(eq, _known_equation_types):
-                rcs = rcs.union(eq.atoms(Rational))
-        out = set()
-        # Integers are also being returned as Rational numbers, remove any integers
-        for rc in rcs:
-            if not isinstance(rc, Integer):
-                out.add(rc)
-        return out
+        return self._scan_equations()['rationals']
 
     @property
     def Inverse_constants(self):
         # Only negative powers i.e. they correspond to division and they are stored into constant arrays
-        inverse_terms = set()
-        for eq in self.equations:
-            if isinstance(eq, _known_equation_types):
-                for at in eq.atoms(Pow):
-                    if _coeff_isneg(at.exp) and not (at.base.atoms(Indexed) or isinstance(at, GridVariable)):
-                        inverse_terms.add(at)
-        return inverse_terms
+        return self._scan_equations()['inverses']
 
     @property
     def constants(self):
-        consts = set()
-        for eq in self.equations:
-            if isinstance(eq, _known_equation_types):
-                consts = consts.union(eq.atoms(ConstantObject))
-        return consts
+        return self._scan_equations()['constants']
 
     @property
     def IndexedConstants(self):
-        consts = set()
-        for eq in self.equations:
-            if isinstance(eq, _known_equation_types):
-                consts = consts.union(eq.atoms(ConstantIndexed))
-        return consts
+        return self._scan_equations()['indexed_constants']
 
     @property
     def global_variables(self):
-        globals_vars_lhs = set()
         globals_vars_rhs = set()
-        for eq in self.equations:
-            if isinstance(eq, _known_equation_types):
-                globals_vars_lhs = globals_vars_lhs.union(eq.atoms(GlobalValue))
+        globals_vars_lhs = self._scan_equations()['global_variables']
         return globals_vars_rhs, globals_vars_lhs
 
+    @property
+    def grid_variables(self):
+        """ Returns the grid variables used in the kernel, these are declared at the start of the kernel."""
+        return self._scan_equations()['grid_variables']
+
     @property
     def grid_indices_used(self):
-        for eq in self.equations:
-            if isinstance(eq, _known_equation_types):
-                if eq.atoms(Grididx):
-                    return True
-        return False
+        return self._scan_equations()['grid_indices_used']
 
     def get_stencils(self):
         """ Returns the stencils for the datasets used in the kernel."""
-        stencil_dictionary = {}
-        datasets = set()
-        for eq in self.equations:
-            if isinstance(eq, _known_equation_types):
-                datasets = datasets.union(eq.atoms(DataSet))
-
-        for s in datasets:
-            if s.base in stencil_dictionary.keys():
-                stencil_dictionary[s.base].add(tuple(s.indices))
-            else:
-                stencil_dictionary[s.base] = set()
-                stencil_dictionary[s.base].add(tuple(s.indices))
-        for key, val in stencil_dictionary.iteritems():
-            stencil_dictionary[key] = frozenset(val)
+        cache = self._scan_equations()
+        if 'stencils' in cache:
+            return cache['stencils']
+        stencil_dictionary = defaultdict(set)
+        # The indices of a dataset are already a tuple, so they are used directly as the stencil point
+        for s in cache['datasets']:
+            stencil_dictionary[s.base].add(s.indices)
+        stencil_dictionary = {key: frozenset(val) for key, val in stencil_dictionary.items()}
+        cache['stencils'] = stencil_dictionary
         return stencil_dictionary
 
     def write_latex(self, latex):
@@ -248,12 +332,12 @@ class Kernel(object):
             name = latex.latexify_expression(self.computation_name, mode='inline')
         latex.write_string('The kernel is %s, block is %d' % (name, self.block_number))
         range_of_eval = self.total_range()
-        latex.write_string('The ranges are %s' % (','.join([str(d) for d in flatten(range_of_eval)])))
+        latex.write_string('The ranges are %s' % (','.join(map(str, range_of_eval))))
         for index, eq in enumerate(self.equations):
             if isinstance(eq, Equality):
                 latex.write_expression(eq)
             elif isinstance(eq, GroupedPiecewise):
-                print "Should be doing latex for grouped piecewise"  # TODO
+                print("Should be doing latex for grouped piecewise")  # TODO
         return
 
     def total_range(self):
@@ -266,57 +350,48 @@ class Kernel(object):
         elif isinstance(self.halo_ranges, ConstantIndexed) or isinstance(self.ranges, ConstantIndexed):
             raise NotImplementedError("handling ranges and halo_ranges of different types is not implemented")
         else:
-            halo_m, halo_p = get_min_max_halo_values(self.halo_ranges)
-            range_of_eval = [[0, 0] for r in range(self.ndim)]
+            halo_m, halo_p = self._get_halo_mm()
+            # The start and end of the range in each direction, as a flat list
             for d in range(self.ndim):
-                range_of_eval[d][0] = self.ranges[d][0] + halo_m[d]
-                range_of_eval[d][1] = self.ranges[d][1] + halo_p[d]
-            range_of_eval = flatten(range_of_eval)
+                range_of_eval += [self.ranges[d][0] + halo_m[d], self.ranges[d][1] + halo_p[d]]
         return range_of_eval
 
+    def _ops_arg_dat(self, dset, access, dtype):
+        """ Formats the ops_arg_dat argument of a dataset accessed in the kernel."""
+        # WARNING dtype
+        return 'ops_arg_dat(%s, %d, %s, \"%s\", %s)' % (dset, 1, self.stencil_names[dset], dtype, self.opsc_access[access])
+
+    def _ops_arg_gbl(self, constant, access, dtype):
+        """ Formats the ops_arg_gbl argument of a global constant or variable accessed in the kernel."""
+        return "ops_arg_gbl(&%s, %d, \"%s\", %s)" % (constant, 1, dtype, self.opsc_access[access])
+
     @property
     def opsc_code(self):
         """ Creates the OPSC code for a kernel."""
         block_name = self.block_name
-        name = self.kernelname
-        ins = self.rhs_datasetbases
-        outs = self.lhs_datasetbases
-        inouts = ins.intersection(outs)
-        ins = ins.difference(inouts)
-        outs = outs.difference(inouts)
+        name = self.function_name
+        ins, outs, inouts = self.dataset_accesses
         if len(self.equations) == 0:
             raise ValueError("Kernel %s does not have any equations." % self.computation_name)
         range_of_eval = self.total_range()
         dtype = Int().opsc()
         iter_name = "iteration_range_%d_block%d" % (self.kernel_no, self.block_number)
-        iter_name_code = ['%s %s[] = {%s};' % (dtype, iter_name, ', '.join([str(s) for s in flatten(range_of_eval)]))]
-        code = []
+        iter_name_code = ['%s %s[] = {%s};' % (dtype, iter_name, ', '.join(map(str, range_of_eval)))]
         # TODO check the dtype from the dataset
         sim_dtype = SimulationDataType.opsc()
-        code += ['ops_par_loop(%s, \"%s\", %s, %s, %s' % (name, self.computation_name, block_name, self.ndim, iter_name)]
-        for i in ins:
-            code += ['ops_arg_dat(%s, %d, %s, \"%s\", %s)' % (i, 1, self.stencil_names[i], sim_dtype, self.opsc_access['ins'])]  # WARNING dtype
-        for o in outs:
-            code += ['ops_arg_dat(%s, %d, %s, \"%s\", %s)' % (o, 1, self.stencil_names[o], sim_dtype, self.opsc_access['outs'])]  # WARNING dtype
-        for io in inouts:
-            code += ['ops_arg_dat(%s, %d, %s, \"%s\", %s)' % (io, 1, self.stencil_names[io], sim_dtype, self.opsc_access['inouts'])]  # WARNING dtype
-        if self.IndexedConstants:
-            for c in self.IndexedConstants:
-                code += ["ops_arg_gbl(&%s, %d, \"%s\", %s)" % (c, 1, sim_dtype, self.opsc_access['ins'])]
-        if self.global_variables:
-            # We need to write the size of an array for global indexed
-            global_ins, global_outs = self.global_variables
-            if global_ins.intersection(global_outs):
-                raise NotImplementedError("Input output of global variables is not implemented")
-            for c in global_ins:
-                code += ["ops_arg_gbl(&%s, %d, \"%s\", %s)" % (c, 1, c.datatype.opsc(), self.opsc_access['ins'])]
-            for c in global_outs:
-                code += ["ops_arg_gbl(&%s, %d, \"%s\", %s)" % (c, 1, c.datatype.opsc(), self.opsc_access['outs'])]
+        code = ['ops_par_loop(%s, \"%s\", %s, %s, %s' % (name, self.computation_name, block_name, self.ndim, iter_name)]
+        code += [self._ops_arg_dat(d, access, sim_dtype) for access, dsets in (('ins', ins), ('outs', outs), ('inouts', inouts)) for d in dsets]
+        code += [self._ops_arg_gbl(c, 'ins', sim_dtype) for c in self.IndexedConstants]
+        # We need to write the size of an array for global indexed
+        global_ins, global_outs = self.global_variables
+        if global_ins.intersection(global_outs):
+            raise NotImplementedError("Input output of global variables is not implemented")
+        code += [self._ops_arg_gbl(c, access, c.datatype.opsc()) for access, gbls in (('ins', global_ins), ('outs', global_outs)) for c in gbls]
         if self.grid_indices_used:
             code += ["ops_arg_idx()"]
-        code = [',\n'.join(code) + ');\n\n']  # WARNING dtype
-        code = iter_name_code + code
-        return code
+        # The iteration range declaration followed by the call, joined once
+        iter_name_code.append(',\n'.join(code) + ');\n\n')  # WARNING dtype
+        return iter_name_code
 
     def ops_argument_call(self, array, stencil, precision, access_type):
         template = 'ops_arg_dat(%s, %d, %s, \"%s\", %s)'
@@ -335,9 +410,10 @@ class Kernel(object):
         3. d.halo_ranges to kernel halo ranges."""
         self.stencil_names = {}
         dsets = self.lhs_datasetbases.union(self.rhs_datasetbases)
+        halos = None
         # New logic for the dataset delcarations across blocks
         for d in dsets:
-            if str(d) in block.block_datasets.keys():
+            if str(d) in block.block_datasets:
                 dset = block.block_datasets[str(d)]
                 block.block_datasets[str(d)] = dset
                 if block.blocknumber != dset.block_number:
@@ -345,26 +421,48 @@ class Kernel(object):
                 if block.shape != dset.size:
                     raise ValueError("Shape error")
             else:
-                # Update dataset attributes
-                d = dataset_attributes(d)
-                d.size = block.shape
-                d.block_number = block.blocknumber
-                d.halo_ranges = [[set(), set()] for d1 in range(block.ndim)]
-                for direction in range(len(d.halo_ranges)):
-                    d.halo_ranges[direction][0] = block.get_all_scheme_halos()
-                    d.halo_ranges[direction][1] = block.get_all_scheme_halos()
-                d.block_name = block.blockname
-                # Add dataset to block datasets
-                block.block_datasets[str(d)] = d
+                # Update dataset attributes and add the dataset to block datasets
+                if halos is None:
+                    halos = block.get_all_scheme_halos()
+                block.block_datasets[str(d)] = initialise_block_dataset(d, block, halos)
 
         stens = self.get_stencils()
-        for dset, stencil in stens.iteritems():
-            if stencil not in block.block_stencils.keys():
-                name = 'stencil_%d_%02d' % (block.blocknumber, len(block.block_stencils.keys()))
-
+        for dset, stencil in stens.items():
+            if stencil not in block.block_stencils:
+                name = 'stencil_%d_%02d' % (block.blocknumber, len(block.block_stencils))
                 block.block_stencils[stencil] = StencilObject(name, stencil, block.ndim)
             if dset not in self.stencil_names:
                 self.stencil_names[dset] = block.block_stencils[stencil].name
             else:
                 self.stencil_names[dset].add(block.block_stencils[stencil].name)
         return
+
+
+def fuse_kernels(components, block):
+    """ Fuses the consecutive kernels in a list of algorithm components that can be evaluated in a single loop,
+    see Kernel.can_fuse. Any component that is not a kernel is left in place and ends the group of kernels being fused.
+    The fused kernels are new kernels, the given kernels are not modified as they can be used elsewhere in the algorithm.
+
+    :arg list components: The algorithm components.
+    :arg block: The block the kernels are evaluated on.
+    :returns: The components with the fused kernels.
+    :rtype: list"""
+    groups = []
+    for c in components:
+        if isinstance(c, Kernel) and groups and isinstance(groups[-1][-1], Kernel) and all(k.can_fuse(c) for k in groups[-1]):
+            groups[-1] += [c]
+        else:
+            groups += [[c]]
+    fused = []
+    for group in groups:
+        if len(group) == 1:
+            fused += group
+            continue
+        kernel = Kernel(block, ', '.join(str(k.computation_name) for k in group))
+        kernel.ranges = [list(r) for r in group[0].ranges]
+        for k in group:
+            kernel.equations += k.equations
+            kernel.merge_halo_range(k.halo_ranges)
+        kernel.update_block_datasets(block)
+        fused += [kernel]
+    return fused
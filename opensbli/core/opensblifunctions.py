@@ -17,6 +17,7 @@
 #    You should have received a copy of the GNU General Public License
 #    along with OpenSBLI.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import OrderedDict
 from sympy import Sum, Symbol, Function, Eq, flatten, S, pprint, Mul, Expr
 from sympy.tensor import IndexedBase, Indexed, get_contraction_structure
 from sympy.tensor.index_methods import get_indices as get_indices_sympy
@@ -307,7 +308,7 @@ class BasicDiscretisation(EinsteinStructure):
     @property
     def required_datasetbases(cls):
         objs = list(cls.args[0].atoms(DataSetBase)) + list(cls.work.atoms(DataSetBase))
-        return list(set(objs))
+        return list(OrderedDict.fromkeys(objs))
 
     @property
     def required_constants(cls):
@@ -338,10 +339,9 @@ class BasicDiscretisation(EinsteinStructure):
 
     @property
     def is_homogeneous(cls):
-        if len(set(cls.args[1:])) == 1:
-            return True
-        else:
-            return False
+        # Compare each direction against the first one, stopping at the first mismatch
+        directions = cls.args[1:]
+        return bool(directions) and all(d == directions[0] for d in directions[1:])
 
     @property
     def is_store(cls):
@@ -617,9 +617,8 @@ class WenoDerivative(Function, BasicDiscretisation, DerPrint):
         return "%s" % ("WD")
 
     def update_settings(self, **settings):
-        existing_keys = self.settings.keys()
-        for key in settings.keys():
-            if key in self.settings.keys():
+        for key in settings:
+            if key in self.settings:
                 raise ValueError("Key exists")
         self.settings.update(settings)
         return
@@ -670,7 +669,7 @@ class WenoDerivative(Function, BasicDiscretisation, DerPrint):
     @property
     def evaluate_reconstruction(self):
         # Check if the reconstruction placeholders are combined, other options should be added here
-        if self.settings.has_key("combine_reconstructions") and self.settings["combine_reconstructions"]:
+        if "combine_reconstructions" in self.settings and self.settings["combine_reconstructions"]:
             variables = set([r.reconstructed_symbol for r in self.reconstructions])
             if len(variables) == 1:
                 return list(variables)[0]
@@ -700,9 +699,8 @@ class TenoDerivative(Function, BasicDiscretisation, DerPrint):
         return "%s" % ("TD")
 
     def update_settings(self, **settings):
-        existing_keys = self.settings.keys()
-        for key in settings.keys():
-            if key in self.settings.keys():
+        for key in settings:
+            if key in self.settings:
                 raise ValueError("Key exists")
         self.settings.update(settings)
         return
@@ -742,7 +740,7 @@ class TenoDerivative(Function, BasicDiscretisation, DerPrint):
     @property
     def evaluate_reconstruction(self):
         # Check if the reconstruction placeholders are combined, other options should be added here
-        if self.settings.has_key("combine_reconstructions") and self.settings["combine_reconstructions"]:
+        if "combine_reconstructions" in self.settings and self.settings["combine_reconstructions"]:
             variables = set([r.reconstructed_symbol for r in self.reconstructions])
             if len(variables) == 1:
                 return list(variables)[0]
@@ -0,0 +1,133 @@
+#    OpenSBLI: An automatic code generator for solving differential equations.
+#    Copyright (c) see License file
+
+#    This file is part of OpenSBLI.
+
+#    OpenSBLI is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    OpenSBLI is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with OpenSBLI.  If not, see <http://www.gnu.org/licenses/>.
+
+from opensbli.core.block import SimulationBlock
+from opensbli.core.kernel import Kernel, StencilObject, fuse_kernels
+from opensbli.utilities.helperfunctions import increment_dataset
+from opensbli.core.opensbliobjects import ConstantObject, ConstantIndexed
+from opensbli.equation_types.opensbliequations import OpenSBLIEq
+from sympy import Rational, Idx
+import pytest
+
+
+@pytest.fixture
+def block0_2d():
+    return SimulationBlock(2)
+
+
+def test_kernel_atoms_cache(block0_2d):
+    """Checks that the kernel properties are updated when equations are added"""
+    kernel = Kernel(block0_2d)
+    u = block0_2d.location_dataset('u')
+    v = block0_2d.location_dataset('v')
+    rho = block0_2d.location_dataset('rho')
+    kernel.add_equation(OpenSBLIEq(u, Rational(1, 2)*v))
+    assert kernel.lhs_datasetbases == set([u.base])
+    assert kernel.rhs_datasetbases == set([v.base])
+    assert kernel.Rational_constants == set([Rational(1, 2)])
+    c = ConstantObject('c')
+    assert c not in kernel.constants
+    # Repeated access returns the same stored object
+    assert kernel.rhs_datasetbases is kernel.rhs_datasetbases
+    kernel.add_equation(OpenSBLIEq(v, c*rho))
+    assert kernel.lhs_datasetbases == set([u.base, v.base])
+    assert kernel.rhs_datasetbases == set([v.base, rho.base])
+    assert c in kernel.constants
+    assert set(kernel.get_stencils().keys()) == set([u.base, v.base, rho.base])
+    return
+
+
+def test_stencil_sorted_indices():
+    """Checks that the sorted stencil locations are stored when the stencil is created"""
+    stencil = StencilObject('test_stencil_00', frozenset([(0, 1), (0, -1), (1, 0), (0, 0)]), 2)
+    assert stencil.sort_stencil_indices() == [(0, -1), (0, 0), (0, 1), (1, 0)]
+    return
+
+
+def test_kernel_hash(block0_2d):
+    """Checks that the kernel hash is given by the kernel name and is unchanged when equations are added"""
+    kernel = Kernel(block0_2d)
+    assert hash(kernel) == hash(kernel.kernelname)
+    assert hash(kernel) == hash(kernel)
+    u = block0_2d.location_dataset('u')
+    kernel.add_equation(OpenSBLIEq(u, Rational(1, 2)))
+    assert hash(kernel) == hash(kernel.kernelname)
+    assert hash(kernel) != hash(Kernel(block0_2d))
+
+
+def test_kernel_dataset_accesses(block0_2d):
+    """Checks the split of the kernel datasets into inputs, outputs and input-outputs"""
+    kernel = Kernel(block0_2d)
+    u = block0_2d.location_dataset('u')
+    v = block0_2d.location_dataset('v')
+    rho = block0_2d.location_dataset('rho')
+    kernel.add_equation(OpenSBLIEq(u, v*rho))
+    kernel.add_equation(OpenSBLIEq(rho, 2*rho))
+    assert kernel.dataset_accesses == (set([v.base]), set([u.base]), set([rho.base]))
+
+
+def test_kernel_fusion(block0_2d):
+    """Checks that only the kernels without a dependency between grid points are fused"""
+    u = block0_2d.location_dataset('u')
+    v = block0_2d.location_dataset('v')
+    rho = block0_2d.location_dataset('rho')
+    kernels = [Kernel(block0_2d, 'first'), Kernel(block0_2d, 'second'), Kernel(block0_2d, 'third')]
+    kernels[0].add_equation(OpenSBLIEq(u, 2*rho))
+    # Reads u at the grid point, so it can be evaluated in the same loop
+    kernels[1].add_equation(OpenSBLIEq(v, u*rho))
+    # Reads v at the neighbouring points
+    kernels[2].add_equation(OpenSBLIEq(rho, increment_dataset(v, 0, 1) - increment_dataset(v, 0, -1)))
+    block0_2d.set_discretisation_schemes({})
+    for k in kernels:
+        k.ranges = [[0, 10], [0, 10]]
+        k.update_block_datasets(block0_2d)
+    assert kernels[0].can_fuse(kernels[1])
+    assert not kernels[1].can_fuse(kernels[2])
+    fused = fuse_kernels(kernels, block0_2d)
+    assert len(fused) == 2 and fused[1] is kernels[2]
+    assert fused[0].lhs_datasetbases == set([u.base, v.base])
+    assert fused[0].computation_name == 'first, second'
+    # The fused kernels are left unchanged
+    assert kernels[0].lhs_datasetbases == set([u.base])
+    assert kernels[0].computation_name == 'first'
+    # Kernels with symbolic ranges can not be compared, so they are not fused
+    kernels[1].ranges = ConstantIndexed('split_range', Idx('i', 4))
+    assert not kernels[0].can_fuse(kernels[1])
+
+
+def test_kernel_halo_ranges_shared_with_block(block0_2d):
+    """Checks that a boundary kernel sharing the block halos gets the halos added to the block after it is created,
+    as for the boundary conditions of an equation class discretised before another with wider halos"""
+    class Halo(object):
+        def __init__(self, width):
+            self.width = width
+
+        def get_halos(self, side):
+            return [-self.width, self.width][side]
+    kernel = Kernel(block0_2d)
+    kernel.ranges = [[0, 10], [0, 10]]
+    block0_2d.set_block_boundary_halos(1, 0, Halo(2))
+    # The boundary conditions assign the block halo sets to the kernel
+    kernel.halo_ranges[1][0] = block0_2d.boundary_halos[1][0]
+    assert kernel.total_range() == [0, 10, -2, 10]
+    block0_2d.set_block_boundary_halos(1, 0, Halo(5))
+    assert kernel.total_range() == [0, 10, -5, 10]
+    # Setting a halo on the kernel leaves the block halos unchanged
+    kernel.set_halo_range(1, 0, Halo(3))
+    assert len(block0_2d.boundary_halos[1][0]) == 2
+    assert kernel.total_range() == [0, 10, -5, 10]
@@ -0,0 +1,40 @@
+#    OpenSBLI: An automatic code generator for solving differential equations.
+#    Copyright (c) see License file
+
+#    This file is part of OpenSBLI.
+
+#    OpenSBLI is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+
+#    OpenSBLI is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+
+#    You should have received a copy of the GNU General Public License
+#    along with OpenSBLI.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from opensbli.code_generation.opsc import write_file, substitute_input_constants
+
+
+def generate(value):
+    """Writes the main program in the same way as OPSC when the simulation parameters are given"""
+    return write_file('opensbli.cpp', substitute_input_constants('double c0;\nc0=Input;\n', {'c0': value}))
+
+
+def test_unchanged_main_program_not_written(tmpdir):
+    """Checks that generating the same code twice does not write the main program again"""
+    path = str(tmpdir.join('opensbli.cpp'))
+    with tmpdir.as_cwd():
+        assert generate(0.5)
+        # Move the times to the past, so that any rewrite is detected
+        os.utime(path, (1000, 1000))
+        assert not generate(0.5)
+        assert os.stat(path).st_mtime == 1000
+        # A different parameter value is written
+        assert generate(0.25)
+    with open(path) as f:
+        assert f.read() == 'double c0;\nc0 = 0.25;\n'
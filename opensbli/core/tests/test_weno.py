@@ -225,7 +225,7 @@ def test_WenoConfig(weno_config):
     assert len(weno_config.c_rj) == k**2
     # Check symbolic dictionary is being created correctly
     points, sym_dict = weno_config.generate_symbolic_function_points
-    for index, fn in sym_dict.iteritems():
+    for index, fn in sym_dict.items():
         assert fn.args[-1] == index
         assert fn in points
         assert isinstance(fn, Indexed) is True
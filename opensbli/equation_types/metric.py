@@ -287,7 +287,7 @@ class MetricsEquation(NonSimulationEquations, Discretisation, Solution):
         return
 
     def process_kernels(cls, block):
-        for key, kernel in cls.constituent_relations_kernels.iteritems():
+        for key, kernel in cls.constituent_relations_kernels.items():
             if isinstance(kernel, Kernel):
                 kernel.update_block_datasets(block)
         for kernel in cls.Kernels:
@@ -23,6 +23,7 @@
    @details base classes for different type of equations used in opensbli
 """
 
+from collections import OrderedDict
 from opensbli.core.opensbliobjects import DataSet, ConstantObject, DataSetBase, DataObject
 from opensbli.core.opensblifunctions import TemporalDerivative
 from sympy import flatten, preorder_traversal
@@ -79,8 +80,10 @@ class Discretisation(object):
         :return: a set of functions
         :rtype: set(CentralDerivative, WenoDerivative, TemporalDerivative, etc.) """
         fns = cls.required_functions_local
-        allfns = flatten([[fn, fn.required_functions] for fn in fns])
-        allfns = set(allfns)
+        allfns = set()
+        for fn in fns:
+            allfns.add(fn)
+            allfns.update(fn.required_functions)
         return allfns
 
     def _sanitise_equations(cls, equation):
@@ -311,8 +314,8 @@ class SimulationEquations(Discretisation, Solution):
         cls.requires = {}
         for no, sc in enumerate(spatialschemes):
             cls.constituent_evaluations[sc] = schemes[sc].discretise(cls, block)
-            for key, value in cls.constituent_evaluations[sc].iteritems():
-                if key in cr_dictionary.keys():
+            for key, value in cls.constituent_evaluations[sc].items():
+                if key in cr_dictionary:
                     if key in cls.constituent_relations_kernels:
                         cls.constituent_relations_kernels[key].merge_halo_range(value.halo_ranges)
                     else:
@@ -324,7 +327,7 @@ class SimulationEquations(Discretisation, Solution):
         missing_CR_datasets = cls.get_required_constituents.difference(cls.constituent_relations_kernels.keys())
         for dset in missing_CR_datasets:
             # Evaluation of missing dataset is required
-            if dset in cr_dictionary.keys():
+            if dset in cr_dictionary:
                 for kernel in cr_dictionary[dset].kernels:
                     cls.constituent_relations_kernels[kernel.equations[0].lhs] = kernel
         cls.process_kernels(block)
@@ -335,7 +338,7 @@ class SimulationEquations(Discretisation, Solution):
 
         :param SimulationBlock block: the block on which the equations are solved
         :return: None """
-        for key, kernel in cls.constituent_relations_kernels.iteritems():
+        for key, kernel in cls.constituent_relations_kernels.items():
             kernel.update_block_datasets(block)
         for kernel in cls.Kernels:
             kernel.update_block_datasets(block)
@@ -345,14 +348,14 @@ class SimulationEquations(Discretisation, Solution):
         """Sort the constituent relation kernels
         """
         input_order = []
-        for a in cls.requires.keys():
+        for a in cls.requires:
             if isinstance(a, DataSet):
                 input_order += [a.base]
             else:
                 input_order += [a]
 
         dictionary = {}
-        for key, value in cls.constituent_relations_kernels.iteritems():
+        for key, value in cls.constituent_relations_kernels.items():
             dictionary[key.base] = value
         order_of_evaluation = cls.sort_dictionary(input_order, dictionary, block)
         ordered_kernels = []
@@ -379,10 +382,10 @@ class SimulationEquations(Discretisation, Solution):
         dictionary = new_dictionary
         # reverse_dictionary = {}
         order = flatten(order + list(block.known_datasets))
-        order = list(set(order))
+        order = list(OrderedDict.fromkeys(order))
         # store the length of order
         input_order = len(order)
-        key_list = [key for key in dictionary.keys() if key not in order]
+        key_list = [key for key in dictionary if key not in order]
         requires_list = ([dictionary[key].rhs_datasetbases for key in key_list])
         zipped = zip(key_list, requires_list)
         # Breaks after 1000 iterations
@@ -390,7 +393,7 @@ class SimulationEquations(Discretisation, Solution):
         while key_list:
             iter_count = iter_count+1
             order += [x for (x, y) in zipped if all(req in order for req in y)]
-            key_list = [key for key in dictionary.keys() if key not in order]
+            key_list = [key for key in dictionary if key not in order]
             requires_list = [dictionary[key].rhs_datasetbases for key in key_list]
             zipped = zip(key_list, requires_list)
             if iter_count > 1000:
@@ -23,6 +23,7 @@
    @details
 """
 
+from collections import OrderedDict
 from sympy import flatten, pprint, srepr
 from opensbli.code_generation.algorithm.common import AfterSimulationEnds
 from opensbli.equation_types.opensbliequations import NonSimulationEquations, Discretisation, Solution, DataSet
@@ -122,8 +123,8 @@ class PostProcessEquations(NonSimulationEquations, Discretisation, Solution):
         cls.requires = {}
         for no, sc in enumerate(spatialschemes):
             cls.constituent_evaluations[sc] = schemes[sc].discretise(cls, block)
-            for key, value in cls.constituent_evaluations[sc].iteritems():
-                if key in cr_dictionary.keys():
+            for key, value in cls.constituent_evaluations[sc].items():
+                if key in cr_dictionary:
                     if key in cls.constituent_relations_kernels:
                         cls.constituent_relations_kernels[key].merge_halo_range(value.halo_ranges)
                     else:
@@ -134,7 +135,7 @@ class PostProcessEquations(NonSimulationEquations, Discretisation, Solution):
         missing_CR_datasets = cls.get_required_constituents.difference(cls.constituent_relations_kernels.keys())
         for dset in missing_CR_datasets:
             # Evaluation of missing dataset is required
-            if dset in cr_dictionary.keys():
+            if dset in cr_dictionary:
                 for kernel in cr_dictionary[dset].kernels:
                     cls.constituent_relations_kernels[kernel.equations[0].lhs] = kernel
         cls.Kernels = cls.sort_constituents + cls.Kernels
@@ -145,7 +146,7 @@ class PostProcessEquations(NonSimulationEquations, Discretisation, Solution):
         """A function to update some dependent parameters of each kernel.
         :param SimulationBlock block: the block on which the equations are solved
         :return: None """
-        for key, kernel in cls.constituent_relations_kernels.iteritems():
+        for key, kernel in cls.constituent_relations_kernels.items():
             kernel.update_block_datasets(block)
         for kernel in cls.Kernels:
             kernel.update_block_datasets(block)
@@ -155,7 +156,7 @@ class PostProcessEquations(NonSimulationEquations, Discretisation, Solution):
     def sort_constituents(cls):
         """Sort the constituent relation kernels."""
         input_order = []
-        for a in cls.requires.keys():
+        for a in cls.requires:
             if isinstance(a, DataSet):
                 input_order += [a.base]
             else:
@@ -163,7 +164,7 @@ class PostProcessEquations(NonSimulationEquations, Discretisation, Solution):
 
         dictionary = {}
         order_of_evaluation = []
-        for key, value in cls.constituent_relations_kernels.iteritems():
+        for key, value in cls.constituent_relations_kernels.items():
             dictionary[key.base] = value
             order_of_evaluation += [key.base]
         ordered_kernels = []
@@ -185,10 +186,10 @@ class PostProcessEquations(NonSimulationEquations, Discretisation, Solution):
         dictionary = new_dictionary
         # reverse_dictionary = {}
         order = flatten(order + [a.base for a in flatten(cls.solution_arrays)])
-        order = list(set(order))
+        order = list(OrderedDict.fromkeys(order))
         # store the length of order
         input_order = len(order)
-        key_list = [key for key in dictionary.keys() if key not in order]
+        key_list = [key for key in dictionary if key not in order]
         requires_list = ([dictionary[key].required_datasetbases for key in key_list])
 
         zipped = zip(key_list, requires_list)
@@ -197,7 +198,7 @@ class PostProcessEquations(NonSimulationEquations, Discretisation, Solution):
         while key_list:
             iter_count = iter_count+1
             order += [x for (x, y) in zipped if all(req in order for req in y)]
-            key_list = [key for key in dictionary.keys() if key not in order]
+            key_list = [key for key in dictionary if key not in order]
             requires_list = [dictionary[key].required_datasetbases for key in key_list]
             zipped = zip(key_list, requires_list)
             if iter_count > 1000:
@@ -48,11 +48,11 @@ def read_dataset(openname, dataset):
 
 def strip_halos(fname_to_read, fname_to_write):
     opensbli_file = h5py.File(fname_to_read, 'r')
-    block_name1 = opensbli_file.keys()[0]
+    block_name1 = list(opensbli_file)[0]
     group_block = opensbli_file[block_name1]
     output_opensbli = h5py.File(fname_to_write, 'w')
     # TODO create the same structure of the input file
-    for key in group_block.keys():
+    for key in group_block:
         data_without_halos = read_dataset(group_block, key)
         output_opensbli.create_dataset("%s" % (key), data=data_without_halos)
     output_opensbli.close()
@@ -64,11 +64,11 @@ if(__name__ == "__main__"):
     parser = argparse.ArgumentParser(prog="pat")
     parser.add_argument("input_path", help="Path of the HDF5 file written out from OpenSBLI inlcuding the file name", action="store", type=str)
     args = parser.parse_args()
-    print "Processing HDF5 from the path %s" % args.input_path
+    print("Processing HDF5 from the path %s" % args.input_path)
     a = args.input_path.split('/')
     if '.h5' not in a[-1]:
         raise ValueError("Provide the HDF5 file with .h5 extension")
     h5name_output = a[-1].split('.')[0]
     fname_to_write = '/'.join(a[:-1]+['%s_pp.h5' % h5name_output])
-    print "Output for post processing will be %s" % fname_to_write
+    print("Output for post processing will be %s" % fname_to_write)
     strip_halos(args.input_path, fname_to_write)
@@ -30,7 +30,7 @@ from opensbli.core.opensbliobjects import ConstantObject, DataSet
 from opensbli.core.opensblifunctions import CentralDerivative
 from opensbli.equation_types.opensbliequations import OpenSBLIEq, SimulationEquations
 from opensbli.core.kernel import Kernel
-from opensbli.utilities.helperfunctions import increasing_order
+from opensbli.utilities.helperfunctions import number_of_coordinates
 
 
 class Scheme(object):
@@ -90,7 +90,7 @@ class Central(Scheme):
         :arg int order: The order of accuracy of the scheme.
         """
         Scheme.__init__(self, "CentralDerivative", order)
-        print "A Central scheme of order %d is being used" % order
+        print("A Central scheme of order %d is being used" % order)
         self.schemetype = "Spatial"
         # Points for the spatial scheme
         self.points = list(i for i in range(-order/2, order/2+1))
@@ -171,7 +171,7 @@ class Central(Scheme):
         grouped = {}
         for cd in all_central_derivatives:
             direction = cd.get_direction[0]
-            if direction in grouped.keys():
+            if direction in grouped:
                 grouped[direction] += [cd]
             else:
                 grouped[direction] = [cd]
@@ -182,7 +182,7 @@ class Central(Scheme):
 
         if central_derivative.required_datasets:
             for v in central_derivative.required_datasets:
-                if v in self.required_constituent_relations.keys():
+                if v in self.required_constituent_relations:
                     self.required_constituent_relations[v].set_halo_range(direction, 0, self.halotype)
                     self.required_constituent_relations[v].set_halo_range(direction, 1, self.halotype)
                 else:
@@ -220,14 +220,14 @@ class Central(Scheme):
         convective_grouped = self.group_by_direction(convective)
         if convective_grouped:
             # Create equations for evaluation of derivatives
-            for key, value in convective_grouped.iteritems():
+            for key, value in convective_grouped.items():
                 for v in value:
                     v.update_work(block)
             local_evaluations_group = {}
             function_expressions_group = {}
             # Process the convective derivatives, this requires grouping of equations
             subs_conv = {}
-            for key, value in convective_grouped.iteritems():
+            for key, value in convective_grouped.items():
                 local_evaluations_group[key] = []
                 ev_ker = Kernel(block)
                 ev_ker.set_computation_name("Convective terms group %d" % key)
@@ -258,7 +258,7 @@ class Central(Scheme):
                 function_expressions_group[key] = local
                 block.reset_work_to_stored
             # Convective evaluation
-            for key, value in local_evaluations_group.iteritems():
+            for key, value in local_evaluations_group.items():
                 kernels += value + function_expressions_group[key]
             # Create convective residual
 
@@ -276,7 +276,7 @@ class Central(Scheme):
         viscous_kernels, viscous_discretised = self.general_discretisation(viscous, block, name="Viscous")
         self.check_constituent_relations(block, viscous)
         if viscous_kernels:
-            for ker in sorted(viscous_kernels, cmp=increasing_order):
+            for ker in sorted(viscous_kernels, key=number_of_coordinates):
                 eval_ker = viscous_kernels[ker]
                 kernels += [eval_ker]
         if viscous_discretised:
@@ -59,7 +59,7 @@ class ShockCapturing(object):
             stencil = expression_matrix.stencil_points
             for i in range(expression_matrix.shape[0]):
                 settings = derivatives[i].settings
-                if settings.has_key("combine_reconstructions") and settings["combine_reconstructions"]:
+                if "combine_reconstructions" in settings and settings["combine_reconstructions"]:
                     name = "Recon_%d_%d" % (self.direction, i)
                 else:
                     name = 'L_X%d_%d' % (self.direction, i)
@@ -77,7 +77,7 @@ class ShockCapturing(object):
             stencil = expression_matrix.stencil_points
             for i in range(expression_matrix.shape[0]):
                 settings = derivatives[i].settings
-                if settings.has_key("combine_reconstructions") and settings["combine_reconstructions"]:
+                if "combine_reconstructions" in settings and settings["combine_reconstructions"]:
                     name = "Recon_%d_%d" % (self.direction, i)
                 else:
                     name = 'R_X%d_%d' % (self.direction, i)
@@ -125,7 +125,7 @@ class ShockCapturing(object):
         for s in sym:
             if isinstance(s, DataSetBase):
                 s = s.noblockname
-            if s in self.required_constituent_relations_symbols.keys():
+            if s in self.required_constituent_relations_symbols:
                 self.required_constituent_relations_symbols[s] += [direction]
             else:
                 self.required_constituent_relations_symbols[s] = [direction]
@@ -380,12 +380,12 @@ class Characteristic(EigenSystem):
         averaged_suffix_name = 'AVG_%d' % direction
         self.averaged_suffix_name = averaged_suffix_name
         # Finding flow variables to average
-        required_symbols = self.get_symbols_in_ev(direction).union(self.get_symbols_in_LEV(direction)).union(self.get_symbols_in_REV(direction))
+        required_symbols = self.get_symbols_in_ev(direction).union(self.get_symbols_in_LEV(direction), self.get_symbols_in_REV(direction))
         required_terms = required_symbols.union(required_metrics)
         averaged_equations = self.average(required_terms, direction, averaged_suffix_name, block)
         # Add symbols from the derivatives: e.g. pressure is required
         for d in derivatives:
-            required_symbols = required_symbols.union(d.atoms(DataSetBase))
+            required_symbols.update(d.atoms(DataSetBase))
         return inv_metric, averaged_equations, required_symbols
 
     def create_LEV_inverses(self, direction, avg_LEV_values):
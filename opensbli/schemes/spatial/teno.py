@@ -89,8 +89,8 @@ class ConfigureTeno(object):
         self.fn_points = self.generate_func_points()
         self.eno_coeffs = self.generate_eno_coefficients()
         self.opt_coeffs = self.generate_optimal_coefficients()
-        self.fn_dictionary, self.smoothness_indicators, self.smoothness_symbols = self.generate_smoothness_indicators()
         self.unique_fn_points = sorted(set(flatten(self.fn_points)))
+        self.fn_dictionary, self.smoothness_indicators, self.smoothness_symbols = self.generate_smoothness_indicators()
         # Add the function points and coefficients to the stencil objects
         self.update_stencils()
         return
@@ -165,7 +165,7 @@ class ConfigureTeno(object):
         :returns: fns_dictionary: Key: Integer grid location, Value: placeholder function 'f' at the grid location.
         :returns: smoothness_indicators: List of smoothness indicator expressions.
         :returns: smoothness_symbols: List of placeholder symbols for the smoothness indicators."""
-        points = sorted(list(set(flatten([i for i in self.fn_points]))))
+        points = self.unique_fn_points
         f = IndexedBase('f')
         symbolic_functions = []
         fns = {}
@@ -300,7 +300,7 @@ class TenoReconstructionVariable(object):
         new += self.smoothness_symbols + self.alpha_symbols + self.inv_alpha_sum_symbols + self.kronecker_symbols + self.inv_omega_sum_symbols + self.omega_symbols
         subs_dict = dict(zip(originals, new))
 
-        for key, value in original.function_stencil_dictionary.iteritems():
+        for key, value in original.function_stencil_dictionary.items():
             subs_dict[value] = self.function_stencil_dictionary[key]
 
         self.smoothness_indicators = [s.subs(subs_dict) for s in original.smoothness_indicators]
@@ -331,7 +331,7 @@ class TenoReconstructionVariable(object):
             final_equations += [OpenSBLIEq(value, all_evaluations[no], evaluate=False)]
         self.final_equations = final_equations
         rv = self.reconstructed_symbol
-        if self.settings.has_key("combine_reconstructions") and self.settings["combine_reconstructions"]:
+        if "combine_reconstructions" in self.settings and self.settings["combine_reconstructions"]:
             self.final_equations += [OpenSBLIEq(rv, rv + self.reconstructed_expression)]
         else:
             self.final_equations += [OpenSBLIEq(rv, self.reconstructed_expression)]
@@ -417,7 +417,7 @@ class Teno(Scheme, ShockCapturing):
         grouped = {}
         for cd in all_WDS:
             direction = cd.get_direction[0]
-            if direction in grouped.keys():
+            if direction in grouped:
                 grouped[direction] += [cd]
             else:
                 grouped[direction] = [cd]
@@ -479,7 +479,7 @@ class LLFTeno(LLFCharacteristic, Teno):
 
     def __init__(self, order, physics=None, averaging=None):
         LLFCharacteristic.__init__(self, physics, averaging)
-        print "A TENO scheme of order %s is being used for shock capturing" % str(order)
+        print("A TENO scheme of order %s is being used for shock capturing" % str(order))
         Teno.__init__(self, order)
         return
 
@@ -501,7 +501,7 @@ class LLFTeno(LLFCharacteristic, Teno):
             # Instantiate eigensystems with block, but don't add metrics yet
             self.instantiate_eigensystem(block)
 
-            for direction, derivatives in grouped.iteritems():
+            for direction, derivatives in grouped.items():
                 # Create a work array for each component of the system
                 all_derivatives_evaluated_locally += derivatives
                 for no, deriv in enumerate(derivatives):
@@ -530,7 +530,7 @@ class RFTeno(RFCharacteristic, Teno):
 
     def __init__(self, order, physics=None, averaging=None):
         RFCharacteristic.__init__(self, physics, averaging)
-        print "A TENO scheme of order %s is being used for shock capturing with Roe-flux differencing" % str(order)
+        print("A TENO scheme of order %s is being used for shock capturing with Roe-flux differencing" % str(order))
         Teno.__init__(self, order)
         return
 
@@ -552,7 +552,7 @@ class RFTeno(RFCharacteristic, Teno):
             # Instantiate eigensystems with block, but don't add metrics yet
             self.instantiate_eigensystem(block)
 
-            for direction, derivatives in grouped.iteritems():
+            for direction, derivatives in grouped.items():
                 # Create a work array for each component of the system
                 all_derivatives_evaluated_locally += derivatives
                 for no, deriv in enumerate(derivatives):
@@ -23,6 +23,8 @@
    @details
 """
 
+from functools import reduce
+from operator import mul
 from sympy import IndexedBase, Symbol, Rational, solve, interpolating_poly, integrate, Abs, Float, flatten, S
 from opensbli.core.opensblifunctions import WenoDerivative
 from opensbli.equation_types.opensbliequations import SimulationEquations, OpenSBLIEq
@@ -105,12 +107,8 @@ class ConfigureWeno(object):
                     top_sum = 0
                     bottom_product = 1
                     for l in [x for x in range(k+1) if x != m]:
-                        top_product_total = 1
-                        for q in [x for x in range(k+1) if (x != m and x != l)]:
-                            top_product = r - q + d
-                            top_product_total *= top_product
+                        top_sum += reduce(mul, (r - q + d for q in range(k+1) if (q != m and q != l)), 1)
                         bottom_product *= m - l
-                        top_sum += top_product_total
                     c_rj_sum += Rational(top_sum, bottom_product)
                 c_rj[(r, j)] = c_rj_sum
         return c_rj
@@ -253,7 +251,7 @@ class WenoReconstructionVariable(object):
         self.omega_symbols += [GridVariable('%s' % (s)) for s in original.omega_symbols]
 
         subs_dict = dict(zip(original.smoothness_symbols+original.alpha_symbols+original.inv_alpha_sum_symbols + original.omega_symbols, self.smoothness_symbols+self.alpha_symbols+self.inv_alpha_sum_symbols+self.omega_symbols))
-        for key, value in original.function_stencil_dictionary.iteritems():
+        for key, value in original.function_stencil_dictionary.items():
             subs_dict[value] = self.function_stencil_dictionary[key]
 
         self.smoothness_indicators = [s.subs(subs_dict) for s in original.smoothness_indicators]
@@ -271,7 +269,7 @@ class WenoReconstructionVariable(object):
             final_equations += [OpenSBLIEq(value, all_evaluations[no])]
         self.final_equations = final_equations
         rv = self.reconstructed_symbol
-        if self.settings.has_key("combine_reconstructions") and self.settings["combine_reconstructions"]:
+        if "combine_reconstructions" in self.settings and self.settings["combine_reconstructions"]:
             self.final_equations += [OpenSBLIEq(rv, rv + self.reconstructed_expression)]
         else:
             self.final_equations += [OpenSBLIEq(rv, self.reconstructed_expression)]
@@ -442,7 +440,7 @@ class Weno(Scheme, ShockCapturing):
         grouped = {}
         for cd in all_WDS:
             direction = cd.get_direction[0]
-            if direction in grouped.keys():
+            if direction in grouped:
                 grouped[direction] += [cd]
             else:
                 grouped[direction] = [cd]
@@ -493,7 +491,7 @@ class LLFWeno(LLFCharacteristic, Weno):
             # Instantiate eigensystems with block, but don't add metrics yet
             self.instantiate_eigensystem(block)
 
-            for direction, derivatives in grouped.iteritems():
+            for direction, derivatives in grouped.items():
                 # Create a work array for each component of the system
                 all_derivatives_evaluated_locally += derivatives
                 for no, deriv in enumerate(derivatives):
@@ -544,7 +542,7 @@ class RFWeno(RFCharacteristic, Weno):
             # Instantiate eigensystems with block, but don't add metrics yet
             self.instantiate_eigensystem(block)
 
-            for direction, derivatives in grouped.iteritems():
+            for direction, derivatives in grouped.items():
                 # Create a work array for each component of the system
                 all_derivatives_evaluated_locally += derivatives
                 for no, deriv in enumerate(derivatives):
@@ -136,7 +136,7 @@ class RungeKuttaLS(Scheme):
     def discretise(cls, type_of_eq, block):
         """ Main discretise function for the temporal advancement."""
         # We need only the equations as they contain residual residual_arrays
-        if type_of_eq in cls.solution.keys():
+        if type_of_eq in cls.solution:
             pass
         else:
             cls.solution[type_of_eq] = TemporalSolution()
@@ -25,25 +25,15 @@
 
 from opensbli.core.opensbliobjects import DataSet, CoordinateObject, ConstantIndexed
 import h5py
-from opensbli.code_generation.opsc import rc
-from sympy import pprint
+from opensbli.code_generation.opsc import rc, write_file, substitute_input_constants
+from sympy import Add
 
 
 def get_min_max_halo_values(halos):
-    halo_m = []
-    halo_p = []
     if not isinstance(halos, ConstantIndexed):
-        for direction in range(len(halos)):
-            if halos[direction][0]:
-                hal = [d.get_halos(0) for d in halos[direction][0]]
-                halo_m += [min(hal)]
-            else:
-                halo_m += [0]
-            if halos[direction][1]:
-                hal = [d.get_halos(1) for d in halos[direction][1]]
-                halo_p += [max(hal)]
-            else:
-                halo_p += [0]
+        # The halo types on each side are reduced directly, directions without halos have zero extent
+        halo_m = [min(d.get_halos(0) for d in minus) if minus else 0 for minus, plus in halos]
+        halo_p = [max(d.get_halos(1) for d in plus) if plus else 0 for minus, plus in halos]
         return halo_m, halo_p
     else:
         raise ValueError("")
@@ -56,44 +46,38 @@ def increment_dataset(expression, direction, value):
     arg: int: value: The positive or negative change to apply to the DataSet's index.
     returns: object: expression: The original expression updated to the new DataSet location.
     """
+    # All the datasets are moved together, so a dataset moved onto the location of another is not moved twice
+    mapping = {}
     for dset in expression.atoms(DataSet):
         loc = list(dset.indices)
         loc[direction] = loc[direction] + value
-        new_dset = dset.base[loc]
-        expression = expression.replace(dset, new_dset)
-    return expression
+        mapping[dset] = dset.base[loc]
+    return expression.xreplace(mapping)
 
 
 def dot(v1, v2):
     """Performs the dot product of two variables, they can be lists or single values"""
-    out = 0
     if isinstance(v1, list):
         if len(v1) == len(v2):
-            for i in range(len(v1)):
-                out += v1[i]*v2[i]
-            return out
+            # The sum is created once from all the products, rather than adding one term at a time
+            return Add(*[a*b for a, b in zip(v1, v2)])
         else:
             raise ValueError("")
     else:
         return v1*v2
 
 
-def decreasing_order(s1, s2):
-    return cmp(len(s2.atoms(CoordinateObject)), len(s1.atoms(CoordinateObject)))
-
-
-def increasing_order(s1, s2):
-    return cmp(len(s1.atoms(CoordinateObject)), len(s2.atoms(CoordinateObject)))
+def number_of_coordinates(fn):
+    """ Sort key giving the number of coordinates in the function."""
+    return len(fn.atoms(CoordinateObject))
 
 
 def sort_funcitons(fns, increasing_order=True):
     """Sorts the functions based on the number of arguments in
     increasing order or decreasing order
     """
-    if increasing_order:
-        return (sorted(fns, cmp=increasing_order))
-    else:
-        return (sorted(fns, cmp=decreasing_order))
+    # The key is evaluated once for each function in the call, so nothing is kept between calls
+    return sorted(fns, key=number_of_coordinates, reverse=not increasing_order)
 
 
 def get_inverse_deltas(delta):
@@ -103,13 +87,8 @@ def get_inverse_deltas(delta):
     if delta in rc.existing:
         return rc.existing[delta]
     else:
-        # Create a new inverse variable
-        name = rc.name
-        b, exp = delta.as_base_exp()
-        rc.name = "inv_%d"
-        inv_delta_name = rc.get_next_rational_constant(delta)
-        rc.name = name
-        return inv_delta_name
+        # Create a new inverse variable, which is stored in the existing rationals for the next call
+        return rc.get_next_rational_constant(delta, name="inv_%d")
 
 
 def set_hdf5_metadata(dset, halos, npoints, block):
@@ -138,26 +117,31 @@ def set_hdf5_metadata(dset, halos, npoints, block):
 
 def output_hdf5(array, array_name, halos, npoints, block, **kwargs):
     """ Creates an HDF5 file for reading in data to a simulation,
-    sets the metadata required by the OPS library. """
-    if not isinstance(array, list):
-        array = [array]
-    if not isinstance(array_name, list):
-        array_name = [array_name]
-    assert len(array) == len(array_name)
-    if 'filename' in kwargs.keys():
+    sets the metadata required by the OPS library. The datasets are chunked and compressed with the
+    HDF5 compression filter given by the compression keyword argument, defaults to gzip as it is
+    available in the HDF5 library used by OPS. The compression is disabled with compression=None. """
+    array, array_name = [a if isinstance(a, list) else [a] for a in (array, array_name)]
+    if len(array) != len(array_name):
+        raise ValueError("%d arrays were given with %d array names." % (len(array), len(array_name)))
+    if 'filename' in kwargs:
         fname = kwargs['filename']
     else:
         fname = "data.h5"
+    compression = kwargs.get('compression', 'gzip')
+    if compression:
+        storage = {'chunks': True, 'compression': compression, 'shuffle': True}
+    else:
+        storage = {}
     with h5py.File(fname, 'w') as hf:
-        # Create a group
+        # Create a group, the block attributes are the same for all the datasets
         g1 = hf.create_group(block.blockname)
+        g1.attrs.create("dims", [block.ndim], dtype="int32")
+        g1.attrs.create("ops_type", u"ops_block", dtype="S9")
+        g1.attrs.create("index", [block.blocknumber], dtype="int32")
         # Loop over all the dataset inputs and write to the hdf5 file
         for ar, name in zip(array, array_name):
-            g1.attrs.create("dims", [block.ndim], dtype="int32")
-            g1.attrs.create("ops_type", u"ops_block", dtype="S9")
-            g1.attrs.create("index", [block.blocknumber], dtype="int32")
             block_dset_name = block.location_dataset(name).base
-            dset = g1.create_dataset('%s' % (block_dset_name), data=ar)
+            dset = g1.create_dataset('%s' % (block_dset_name), data=ar, **storage)
             set_hdf5_metadata(dset, halos, npoints, block)
     return
 
@@ -166,21 +150,16 @@ def substitute_simulation_parameters(constants, values, simulation_name='opensbl
     """ Function to substitute user provided numerical values for constants
     defined in the simulation.
 
-    :arg list constants: List of strings, one for each input constant in the simulation.
-    :arg list values: Numerical values corresponding to the strings in the constants list."""
+    :arg list constants: List of strings or constant objects, one for each input constant in the simulation.
+    :arg list values: Numerical values corresponding to the strings in the constants list.
+
+    The values can also be given to OPSC with simulation_parameters, so that the main program is only written once."""
     file_path = "./%s.cpp" % simulation_name
-    substitutions = dict(zip(constants, values))
-    print "Constant simulation values:"
-    pprint(substitutions)
     with open(file_path) as f:
         s = f.read()
-    with open(file_path, 'w') as f:
-        for const, value in substitutions.iteritems():
-            old_str = const + '=Input;'
-            if old_str in s:
-                new_str = const + ' = %s' % value + ';'
-                s = s.replace(old_str, new_str)
-        f.write(s)
+    # The values are looked up by the constant name, so the constant objects can also be given
+    s = substitute_input_constants(s, {str(const): value for const, value in zip(constants, values)})
+    write_file(file_path, s)
     return
 
 
@@ -27,13 +27,14 @@ class UserDefinedEquations(NonSimulationEquations, Discretisation, Solution):
     input to the class
     """
 
-    def __new__(cls, **kwargs):
-        ret = super(UserDefinedEquations, cls).__new__(cls)
-        ret.order = 0
-        ret.equations = []
-        ret.kwargs = kwargs
-        ret._place = []
-        return ret
+    def __init__(self, **kwargs):
+        # The keyword arguments are stored here, as the Solution initialisation does not take any
+        Solution.__init__(self)
+        self.order = 0
+        self.equations = []
+        self.kwargs = kwargs
+        self._place = []
+        return
 
     @property
     def algorithm_place(cls):